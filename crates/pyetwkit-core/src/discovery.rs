@@ -8,6 +8,7 @@ use pyo3::prelude::*;
 use std::collections::HashMap;
 use std::ffi::OsString;
 use std::os::windows::ffi::OsStringExt;
+use std::sync::{Arc, Mutex};
 use uuid::Uuid;
 use windows::core::GUID;
 use windows::Win32::System::Diagnostics::Etw::{
@@ -45,8 +46,79 @@ pub struct ProviderDetails {
     pub keywords: HashMap<String, u64>,
 }
 
+/// Snapshot of the registered providers, indexed for lookup by GUID and name
+struct ProviderIndex {
+    providers: Vec<ProviderInfo>,
+    by_guid: HashMap<Uuid, usize>,
+    /// Keyed on the ASCII-lowercased name; the first registration wins
+    by_name: HashMap<String, usize>,
+}
+
+impl ProviderIndex {
+    fn new(providers: Vec<ProviderInfo>) -> Self {
+        let mut by_guid = HashMap::with_capacity(providers.len());
+        let mut by_name = HashMap::with_capacity(providers.len());
+        for (i, p) in providers.iter().enumerate() {
+            by_guid.entry(p.guid).or_insert(i);
+            by_name.entry(p.name.to_ascii_lowercase()).or_insert(i);
+        }
+        Self {
+            providers,
+            by_guid,
+            by_name,
+        }
+    }
+
+    fn find(&self, name_or_guid: &str) -> Option<&ProviderInfo> {
+        let index = match Uuid::parse_str(name_or_guid) {
+            Ok(guid) => self.by_guid.get(&guid),
+            Err(_) => self.by_name.get(&name_or_guid.to_ascii_lowercase()),
+        };
+        index.map(|&i| &self.providers[i])
+    }
+}
+
+/// Most recent enumeration, shared by every query until a refresh replaces it
+static PROVIDER_INDEX: Mutex<Option<Arc<ProviderIndex>>> = Mutex::new(None);
+
+/// Enumerate providers and replace the cached index
+fn refresh_index() -> Result<Arc<ProviderIndex>> {
+    let index = Arc::new(ProviderIndex::new(enumerate_providers()?));
+    *PROVIDER_INDEX.lock().unwrap_or_else(|e| e.into_inner()) = Some(index.clone());
+    Ok(index)
+}
+
+/// Return the cached index, enumerating providers on first use
+fn cached_index() -> Result<Arc<ProviderIndex>> {
+    let cached = PROVIDER_INDEX
+        .lock()
+        .unwrap_or_else(|e| e.into_inner())
+        .clone();
+    match cached {
+        Some(index) => Ok(index),
+        None => refresh_index(),
+    }
+}
+
+/// Return the index, re-enumerating first if `refresh` is set
+fn provider_index(refresh: bool) -> Result<Arc<ProviderIndex>> {
+    if refresh {
+        refresh_index()
+    } else {
+        cached_index()
+    }
+}
+
 /// List all ETW providers registered on the system
-pub fn list_providers() -> Result<Vec<ProviderInfo>> {
+///
+/// Uses the cached enumeration; pass `refresh` to pick up providers
+/// registered since it was taken.
+pub fn list_providers(refresh: bool) -> Result<Vec<ProviderInfo>> {
+    Ok(provider_index(refresh)?.providers.clone())
+}
+
+/// Enumerate the registered providers through TDH
+fn enumerate_providers() -> Result<Vec<ProviderInfo>> {
     const ERROR_INSUFFICIENT_BUFFER: u32 = 122;
 
     unsafe {
@@ -121,32 +193,33 @@ pub fn list_providers() -> Result<Vec<ProviderInfo>> {
 }
 
 /// Search providers by keyword (case-insensitive partial match)
-pub fn search_providers(keyword: &str) -> Result<Vec<ProviderInfo>> {
-    let all_providers = list_providers()?;
+///
+/// Searches the cached enumeration unless `refresh` is set.
+pub fn search_providers(keyword: &str, refresh: bool) -> Result<Vec<ProviderInfo>> {
+    let index = provider_index(refresh)?;
     let keyword_lower = keyword.to_lowercase();
 
-    let matches: Vec<ProviderInfo> = all_providers
-        .into_iter()
+    let matches: Vec<ProviderInfo> = index
+        .providers
+        .iter()
         .filter(|p| p.name.to_lowercase().contains(&keyword_lower))
+        .cloned()
         .collect();
 
     Ok(matches)
 }
 
 /// Get detailed information about a specific provider
+///
+/// Lookups use the cached index; a miss re-enumerates once so providers
+/// registered since the last enumeration are still found.
 pub fn get_provider_info(name_or_guid: &str) -> Result<Option<ProviderDetails>> {
-    let all_providers = list_providers()?;
-
-    // Try to find by name or GUID
-    let provider = if let Ok(guid) = Uuid::parse_str(name_or_guid) {
-        all_providers.into_iter().find(|p| p.guid == guid)
-    } else {
-        all_providers
-            .into_iter()
-            .find(|p| p.name.eq_ignore_ascii_case(name_or_guid))
-    };
+    let mut index = cached_index()?;
+    if index.find(name_or_guid).is_none() {
+        index = refresh_index()?;
+    }
 
-    match provider {
+    match index.find(name_or_guid).cloned() {
         Some(info) => {
             // Get keywords for this provider
             let keywords = get_provider_keywords(&info.guid).unwrap_or_default();
@@ -272,17 +345,33 @@ impl From<ProviderDetails> for PyProviderDetails {
     }
 }
 
-/// List all ETW providers on the system
+/// List ETW providers on the system, optionally only the first `limit`
+///
+/// The enumeration is cached; `refresh=True` takes a new one.
+///
+/// `limit` only truncates the result. TdhEnumerateProviders returns every
+/// provider in one buffer, so a refresh still enumerates and indexes the full
+/// set; `limit` saves wrapping the rest in Python objects.
 #[pyfunction]
-pub fn py_list_providers() -> PyResult<Vec<PyProviderInfo>> {
-    let providers = list_providers()?;
-    Ok(providers.into_iter().map(PyProviderInfo::from).collect())
+#[pyo3(signature = (limit=None, *, refresh=false))]
+pub fn py_list_providers(limit: Option<usize>, refresh: bool) -> PyResult<Vec<PyProviderInfo>> {
+    let index = provider_index(refresh)?;
+    // Only wrap the providers the caller asked for
+    let count = limit.map_or(index.providers.len(), |n| n.min(index.providers.len()));
+    Ok(index.providers[..count]
+        .iter()
+        .cloned()
+        .map(PyProviderInfo::from)
+        .collect())
 }
 
 /// Search providers by keyword
+///
+/// The enumeration is cached; `refresh=True` takes a new one.
 #[pyfunction]
-pub fn py_search_providers(keyword: &str) -> PyResult<Vec<PyProviderInfo>> {
-    let providers = search_providers(keyword)?;
+#[pyo3(signature = (keyword, *, refresh=false))]
+pub fn py_search_providers(keyword: &str, refresh: bool) -> PyResult<Vec<PyProviderInfo>> {
+    let providers = search_providers(keyword, refresh)?;
     Ok(providers.into_iter().map(PyProviderInfo::from).collect())
 }
 
@@ -299,13 +388,27 @@ mod tests {
 
     #[test]
     fn test_list_providers() {
-        let providers = list_providers().unwrap();
+        let providers = list_providers(true).unwrap();
         assert!(!providers.is_empty());
     }
 
+    #[test]
+    fn test_get_provider_info_by_name_and_guid() {
+        let providers = list_providers(false).unwrap();
+        let first = &providers[0];
+
+        let by_guid = get_provider_info(&first.guid.to_string()).unwrap().unwrap();
+        assert_eq!(by_guid.info.guid, first.guid);
+
+        let by_name = get_provider_info(&first.name.to_ascii_uppercase())
+            .unwrap()
+            .unwrap();
+        assert!(by_name.info.name.eq_ignore_ascii_case(&first.name));
+    }
+
     #[test]
     fn test_search_providers() {
-        let results = search_providers("Kernel").unwrap();
+        let results = search_providers("Kernel", false).unwrap();
         // Should find at least one kernel provider
         assert!(!results.is_empty());
     }
@@ -2,6 +2,7 @@
 
 use chrono::{DateTime, Utc};
 use pyo3::prelude::*;
+use pyo3::sync::GILOnceCell;
 use pyo3::types::{PyDict, PyList};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
@@ -187,9 +188,16 @@ impl EventValue {
 
 /// Python wrapper for EtwEvent
 #[pyclass(name = "EtwEvent")]
-#[derive(Clone)]
 pub struct PyEtwEvent {
     inner: EtwEvent,
+    /// Properties dict, built on first access and reused afterwards
+    properties_cache: GILOnceCell<Py<PyDict>>,
+}
+
+impl Clone for PyEtwEvent {
+    fn clone(&self) -> Self {
+        Self::from(self.inner.clone())
+    }
 }
 
 #[pymethods]
@@ -291,13 +299,19 @@ impl PyEtwEvent {
     }
 
     /// Get event properties as a dictionary
+    ///
+    /// The dictionary is built on first access and the same object is
+    /// returned afterwards, so treat it as read-only.
     #[getter]
     fn properties(&self, py: Python<'_>) -> PyResult<Py<PyDict>> {
-        let dict = PyDict::new(py);
-        for (key, value) in &self.inner.properties {
-            dict.set_item(key, event_value_to_py(py, value)?)?;
-        }
-        Ok(dict.into())
+        let dict = self.properties_cache.get_or_try_init(py, || {
+            let dict = PyDict::new(py);
+            for (key, value) in &self.inner.properties {
+                dict.set_item(key, event_value_to_py(py, value)?)?;
+            }
+            Ok::<_, PyErr>(dict.unbind())
+        })?;
+        Ok(dict.clone_ref(py))
     }
 
     /// Get a specific property by name
@@ -417,7 +431,10 @@ impl PyEtwEvent {
 
 impl From<EtwEvent> for PyEtwEvent {
     fn from(event: EtwEvent) -> Self {
-        Self { inner: event }
+        Self {
+            inner: event,
+            properties_cache: GILOnceCell::new(),
+        }
     }
 }
 
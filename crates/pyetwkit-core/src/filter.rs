@@ -4,19 +4,80 @@ use pyo3::prelude::*;
 use serde::{Deserialize, Serialize};
 use std::sync::Arc;
 
+/// Set of event IDs or opcodes stored as a bitmap
+///
+/// Membership is a single shift and mask instead of a scan over a list.
+/// Serializes as a plain list of IDs.
+#[derive(Clone, Default, PartialEq, Eq, Serialize, Deserialize)]
+#[serde(from = "Vec<u16>", into = "Vec<u16>")]
+pub struct IdSet {
+    bits: Vec<u64>,
+}
+
+impl IdSet {
+    /// Check if the set contains an ID
+    pub fn contains(&self, id: u16) -> bool {
+        let id = usize::from(id);
+        self.bits
+            .get(id >> 6)
+            .is_some_and(|word| (word >> (id & 63)) & 1 != 0)
+    }
+
+    /// Iterate over the IDs in ascending order
+    pub fn iter(&self) -> impl Iterator<Item = u16> + '_ {
+        self.bits.iter().enumerate().flat_map(|(index, &word)| {
+            (0..64u16)
+                .filter(move |bit| (word >> bit) & 1 != 0)
+                .map(move |bit| index as u16 * 64 + bit)
+        })
+    }
+}
+
+impl FromIterator<u16> for IdSet {
+    fn from_iter<I: IntoIterator<Item = u16>>(iter: I) -> Self {
+        let mut bits = Vec::new();
+        for id in iter {
+            let word = usize::from(id) >> 6;
+            if word >= bits.len() {
+                bits.resize(word + 1, 0);
+            }
+            bits[word] |= 1u64 << (id & 63);
+        }
+        Self { bits }
+    }
+}
+
+impl From<Vec<u16>> for IdSet {
+    fn from(ids: Vec<u16>) -> Self {
+        ids.into_iter().collect()
+    }
+}
+
+impl From<IdSet> for Vec<u16> {
+    fn from(set: IdSet) -> Self {
+        set.iter().collect()
+    }
+}
+
+impl std::fmt::Debug for IdSet {
+    fn fmt(&self, f: &mut std::fmt::Formatter<'_>) -> std::fmt::Result {
+        f.debug_set().entries(self.iter()).finish()
+    }
+}
+
 /// Event filter types
 #[derive(Serialize, Deserialize)]
 pub enum EventFilter {
     /// Filter by specific event IDs
-    EventIds(Vec<u16>),
+    EventIds(IdSet),
     /// Filter by opcode
-    Opcodes(Vec<u8>),
+    Opcodes(IdSet),
     /// Filter by process ID
     ProcessId(u32),
     /// Filter by process name (substring match)
     ProcessName(String),
     /// Exclude specific event IDs
-    ExcludeEventIds(Vec<u16>),
+    ExcludeEventIds(IdSet),
     /// Custom predicate (not serializable, uses Arc for Clone)
     #[serde(skip)]
     Custom(Arc<dyn Fn(u16, u8) -> bool + Send + Sync>),
@@ -52,9 +113,9 @@ impl EventFilter {
     /// Check if the filter matches the given event
     pub fn matches(&self, event_id: u16, opcode: u8) -> bool {
         match self {
-            EventFilter::EventIds(ids) => ids.contains(&event_id),
-            EventFilter::Opcodes(ops) => ops.contains(&opcode),
-            EventFilter::ExcludeEventIds(ids) => !ids.contains(&event_id),
+            EventFilter::EventIds(ids) => ids.contains(event_id),
+            EventFilter::Opcodes(ops) => ops.contains(u16::from(opcode)),
+            EventFilter::ExcludeEventIds(ids) => !ids.contains(event_id),
             EventFilter::Custom(f) => f(event_id, opcode),
             // These need additional context, return true for now
             EventFilter::ProcessId(_) | EventFilter::ProcessName(_) => true,
@@ -95,7 +156,7 @@ impl FilterBuilder {
     /// Filter by opcodes
     pub fn opcodes(mut self, opcodes: impl IntoIterator<Item = u8>) -> Self {
         self.filters
-            .push(EventFilter::Opcodes(opcodes.into_iter().collect()));
+            .push(EventFilter::Opcodes(opcodes.into_iter().map(u16::from).collect()));
         self
     }
 
@@ -162,13 +223,14 @@ impl PyEventFilter {
 
     /// Filter by specific event IDs
     fn event_ids(&mut self, ids: Vec<u16>) -> Self {
-        self.filters.push(EventFilter::EventIds(ids));
+        self.filters.push(EventFilter::EventIds(ids.into()));
         self.clone()
     }
 
     /// Filter by opcodes
     fn opcodes(&mut self, opcodes: Vec<u8>) -> Self {
-        self.filters.push(EventFilter::Opcodes(opcodes));
+        self.filters
+            .push(EventFilter::Opcodes(opcodes.into_iter().map(u16::from).collect()));
         self.clone()
     }
 
@@ -186,7 +248,7 @@ impl PyEventFilter {
 
     /// Exclude specific event IDs
     fn exclude_event_ids(&mut self, ids: Vec<u16>) -> Self {
-        self.filters.push(EventFilter::ExcludeEventIds(ids));
+        self.filters.push(EventFilter::ExcludeEventIds(ids.into()));
         self.clone()
     }
 
@@ -211,7 +273,7 @@ mod tests {
 
     #[test]
     fn test_event_id_filter() {
-        let filter = EventFilter::EventIds(vec![1, 2, 3]);
+        let filter = EventFilter::EventIds([1, 2, 3].into_iter().collect());
         assert!(filter.matches(1, 0));
         assert!(filter.matches(2, 0));
         assert!(!filter.matches(4, 0));
@@ -219,7 +281,7 @@ mod tests {
 
     #[test]
     fn test_opcode_filter() {
-        let filter = EventFilter::Opcodes(vec![10, 20]);
+        let filter = EventFilter::Opcodes([10, 20].into_iter().collect());
         assert!(filter.matches(1, 10));
         assert!(filter.matches(1, 20));
         assert!(!filter.matches(1, 30));
@@ -227,12 +289,26 @@ mod tests {
 
     #[test]
     fn test_exclude_filter() {
-        let filter = EventFilter::ExcludeEventIds(vec![100, 200]);
+        let filter = EventFilter::ExcludeEventIds([100, 200].into_iter().collect());
         assert!(filter.matches(1, 0));
         assert!(!filter.matches(100, 0));
         assert!(!filter.matches(200, 0));
     }
 
+    #[test]
+    fn test_id_set() {
+        let set: IdSet = vec![0, 63, 64, 1000, u16::MAX].into();
+        assert!(set.contains(0));
+        assert!(set.contains(63));
+        assert!(set.contains(64));
+        assert!(set.contains(1000));
+        assert!(set.contains(u16::MAX));
+        assert!(!set.contains(1));
+        assert!(!set.contains(999));
+        assert_eq!(Vec::from(set), vec![0, 63, 64, 1000, u16::MAX]);
+        assert!(!IdSet::default().contains(0));
+    }
+
     #[test]
     fn test_process_filter() {
         let filter = EventFilter::ProcessId(1234);
@@ -313,7 +313,7 @@ impl PyEtwProvider {
 
     /// Filter by specific event IDs
     fn event_ids(&mut self, ids: Vec<u16>) -> Self {
-        self.inner.filters.push(EventFilter::EventIds(ids));
+        self.inner.filters.push(EventFilter::EventIds(ids.into()));
         self.clone()
     }
 
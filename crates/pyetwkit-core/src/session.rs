@@ -16,6 +16,7 @@ use ferrisetw::trace::{stop_trace_by_name, TraceTrait, UserTrace};
 use ferrisetw::EventRecord;
 use parking_lot::RwLock;
 use pyo3::prelude::*;
+use pyo3::types::{PyDict, PyList};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::sync::atomic::{AtomicBool, Ordering};
@@ -209,7 +210,7 @@ impl EtwSession {
             for filter in &provider.filters {
                 match filter {
                     EventFilter::EventIds(ids) => {
-                        for &id in ids {
+                        for id in ids.iter() {
                             prov_builder = prov_builder
                                 .add_filter(ferrisetw::provider::EventFilter::ByEventIds(vec![id]));
                         }
@@ -546,6 +547,62 @@ impl PyEtwSession {
         Ok(session.try_next_event().map(PyEtwEvent::from))
     }
 
+    /// Drain up to max_events pending events into columns (non-blocking)
+    ///
+    /// Returns a dict mapping each header field to a list with one value per
+    /// event, or None if no events are pending. The fields are copied straight
+    /// from the channel, so no EtwEvent objects are created.
+    #[pyo3(signature = (max_events=8192))]
+    fn drain_columnar<'py>(
+        &self,
+        py: Python<'py>,
+        max_events: usize,
+    ) -> PyResult<Option<Bound<'py, PyDict>>> {
+        let session = self
+            .inner
+            .as_ref()
+            .ok_or_else(|| pyo3::exceptions::PyRuntimeError::new_err("Session is closed"))?;
+
+        let mut timestamp_ns: Vec<i64> = Vec::new();
+        let mut provider_id: Vec<String> = Vec::new();
+        let mut provider_name: Vec<Option<String>> = Vec::new();
+        let mut event_id: Vec<u16> = Vec::new();
+        let mut process_id: Vec<u32> = Vec::new();
+        let mut thread_id: Vec<u32> = Vec::new();
+        let mut opcode: Vec<u8> = Vec::new();
+        let mut level: Vec<u8> = Vec::new();
+
+        while event_id.len() < max_events {
+            let Some(event) = session.try_next_event() else {
+                break;
+            };
+            timestamp_ns.push(event.timestamp.timestamp_nanos_opt().unwrap_or(0));
+            provider_id.push(event.provider_id.to_string());
+            provider_name.push(event.provider_name);
+            event_id.push(event.event_id);
+            process_id.push(event.process_id);
+            thread_id.push(event.thread_id);
+            opcode.push(event.opcode);
+            level.push(event.level);
+        }
+
+        if event_id.is_empty() {
+            return Ok(None);
+        }
+
+        // Build lists element by element; a Vec<u8> would convert to bytes
+        let batch = PyDict::new(py);
+        batch.set_item("timestamp_ns", PyList::new(py, timestamp_ns)?)?;
+        batch.set_item("provider_id", PyList::new(py, provider_id)?)?;
+        batch.set_item("provider_name", PyList::new(py, provider_name)?)?;
+        batch.set_item("event_id", PyList::new(py, event_id)?)?;
+        batch.set_item("process_id", PyList::new(py, process_id)?)?;
+        batch.set_item("thread_id", PyList::new(py, thread_id)?)?;
+        batch.set_item("opcode", PyList::new(py, opcode)?)?;
+        batch.set_item("level", PyList::new(py, level)?)?;
+        Ok(Some(batch))
+    }
+
     /// Get session statistics
     fn stats(&self) -> PyResult<PySessionStats> {
         let session = self
@@ -10,7 +10,7 @@ from pyetwkit._core import get_provider_info, list_providers, search_providers
 def main():
     # List all providers (limited to first 10)
     print("=== First 10 ETW Providers ===")
-    providers = list_providers()[:10]
+    providers = list_providers(limit=10)
     for p in providers:
         print(f"  {p.name}")
         print(f"    GUID: {p.guid}")
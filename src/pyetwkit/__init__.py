@@ -25,7 +25,8 @@ For async usage:
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __version__ = "3.0.2"
 __author__ = "m96-chan"
@@ -111,17 +112,6 @@ from pyetwkit.providers import (
     RegistryProvider,
 )
 
-# v3.0: Recording & Replay
-from pyetwkit.recording import (
-    CompressionType,
-    EtwpackHeader,
-    EtwpackIndex,
-    Player,
-    Recorder,
-    RecorderConfig,
-    convert_etl_to_etwpack,
-)
-
 # v2.0: Rust-side filtering
 from pyetwkit.rust_filter import RustEventFilter
 from pyetwkit.streamer import EtwStreamer
@@ -142,6 +132,28 @@ from pyetwkit.typed_events import (
 with contextlib.suppress(ImportError):
     from pyetwkit._core import KernelFlags, KernelSession
 
+if TYPE_CHECKING:
+    from pyetwkit.recording import (
+        CompressionType,
+        EtwpackHeader,
+        EtwpackIndex,
+        Player,
+        Recorder,
+        RecorderConfig,
+        convert_etl_to_etwpack,
+    )
+
+# v3.0: Recording & Replay, imported on first access through __getattr__
+_LAZY_IMPORTS = {
+    "CompressionType": "pyetwkit.recording",
+    "EtwpackHeader": "pyetwkit.recording",
+    "EtwpackIndex": "pyetwkit.recording",
+    "Player": "pyetwkit.recording",
+    "Recorder": "pyetwkit.recording",
+    "RecorderConfig": "pyetwkit.recording",
+    "convert_etl_to_etwpack": "pyetwkit.recording",
+}
+
 __all__ = [
     # Version info
     "__version__",
@@ -227,6 +239,17 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve lazily exported names on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
 def is_available() -> bool:
     """Check if the native extension is available.
 
@@ -0,0 +1,53 @@
+"""JSON helpers shared by the dashboard, correlation and recording modules.
+
+orjson is used when it is installed; the standard library json module is the
+fallback. The fallback is configured to match orjson's compact, non-ASCII
+output, and both paths accept dicts with non-str keys. The one remaining
+difference is NaN and infinity, which orjson writes as null.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(data: Any, *, indent: bool = False) -> str:
+    """Encode data as JSON text, indented by two spaces if requested."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option).decode()
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode JSON text or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_file(path: Path) -> Any:
+    """Decode a JSON file, parsing it straight from a memory map with orjson."""
+    if orjson is None:
+        return json.loads(path.read_bytes())
+
+    with path.open("rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return orjson.loads(f.read())
+        with mm, memoryview(mm) as view:
+            return orjson.loads(view)
@@ -245,6 +245,10 @@ class EtwSession:
         """Try to get the next event (non-blocking)."""
         ...
 
+    def drain_columnar(self, max_events: int = 8192) -> dict[str, list[Any]] | None:
+        """Drain up to max_events pending events into columns (non-blocking)."""
+        ...
+
     def stats(self) -> SessionStats:
         """Get session statistics."""
         ...
@@ -21,6 +21,10 @@ from pyetwkit.typed_events import TypedEvent, to_typed_event
 
 T = TypeVar("T")
 
+# Upper bound for the idle poll interval; polling backs off towards this
+# while the session delivers no events
+_MAX_POLL_INTERVAL_MS = 100
+
 
 class AsyncEtwSession:
     """Async ETW session with modern Python async patterns.
@@ -43,7 +47,7 @@ class AsyncEtwSession:
         *,
         buffer_size_kb: int = 64,
         channel_capacity: int = 10000,
-        poll_interval_ms: int = 10,
+        poll_interval_ms: float = 10,
     ) -> None:
         from pyetwkit._core import EtwSession
 
@@ -139,7 +143,7 @@ class AsyncEtwSession:
         if self._started:
             raise RuntimeError("Session already started")
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self._session.start)
         self._started = True
 
@@ -148,13 +152,17 @@ class AsyncEtwSession:
         if not self._started:
             return
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         await loop.run_in_executor(None, self._session.stop)
         self._started = False
 
     @property
     def is_running(self) -> bool:
-        """Check if session is running."""
+        """Check if session is running (without querying the native session)."""
+        return self._started
+
+    def check_session_alive(self) -> bool:
+        """Check that the underlying ETW session is actually running."""
         return self._started and self._session.is_running()
 
     def stats(self) -> SessionStats:
@@ -192,24 +200,38 @@ class AsyncEtwSession:
             await self.start()
 
         count = 0
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        empty_polls = 0
+        poll_interval_ms = self._poll_interval_ms
+        max_interval_ms = max(poll_interval_ms, _MAX_POLL_INTERVAL_MS)
+
+        # Bind hot-path lookups to locals once, outside the poll loop
+        time = loop.time
+        sleep = asyncio.sleep
+        try_next_event = self._session.try_next_event
+        should_process = self._should_process
+        process_callbacks = self._process_callbacks
 
         while max_events is None or count < max_events:
-            if timeout is not None:
-                elapsed = asyncio.get_event_loop().time() - start_time
-                if elapsed >= timeout:
-                    break
+            if deadline is not None and time() >= deadline:
+                break
 
-            event = self._session.try_next_event()
+            event = try_next_event()
 
             if event is None:
-                await asyncio.sleep(self._poll_interval_ms / 1000.0)
+                # Back off while idle
+                delay_ms = min(poll_interval_ms * (1 << min(empty_polls, 4)), max_interval_ms)
+                empty_polls += 1
+                await sleep(delay_ms / 1000.0)
                 continue
 
-            if not self._should_process(event):
+            empty_polls = 0
+
+            if not should_process(event):
                 continue
 
-            await self._process_callbacks(event)
+            await process_callbacks(event)
             yield event
             count += 1
 
@@ -366,11 +388,12 @@ class EventBatcher:
         """
         batch: list[EtwEvent] = []
         batch_count = 0
-        last_yield = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        last_yield = loop.time()
 
         async for event in session.events():
             batch.append(event)
-            now = asyncio.get_event_loop().time()
+            now = loop.time()
 
             should_yield = len(batch) >= self.batch_size or (now - last_yield) >= self.timeout
 
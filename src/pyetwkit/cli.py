@@ -11,6 +11,7 @@ import sys
 import click
 
 from pyetwkit import __version__
+from pyetwkit.profiles import TRACE_LEVELS
 
 
 @click.group()
@@ -132,7 +133,7 @@ def profiles(output_format: str) -> None:
 @click.option(
     "--level",
     "-l",
-    type=click.Choice(["critical", "error", "warning", "info", "verbose"]),
+    type=click.Choice(list(TRACE_LEVELS), case_sensitive=False),
     default="info",
 )
 def listen(
@@ -190,21 +191,12 @@ def listen(
     click.echo(f"Starting ETW session with {len(providers_to_use)} provider(s)...")
     click.echo("Press Ctrl+C to stop\n")
 
-    # Level mapping
-    level_map = {
-        "critical": 1,
-        "error": 2,
-        "warning": 3,
-        "info": 4,
-        "verbose": 5,
-    }
-
     try:
         session = EtwSession("PyETWkitCLI")
 
         for name, guid_or_name in providers_to_use:
             prov = EtwProvider(guid_or_name, name)
-            prov = prov.with_level(level_map.get(level, 4))
+            prov = prov.with_level(TRACE_LEVELS[level.lower()])
             session.add_provider(prov)
 
         session.start()
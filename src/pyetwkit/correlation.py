@@ -6,15 +6,18 @@ using shared identifiers (PID, TID, Handle, SessionID) to build unified activity
 
 from __future__ import annotations
 
-import json
+import bisect
 import logging
-from collections import defaultdict, deque
-from collections.abc import Iterator
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+from pyetwkit import _json
+
 if TYPE_CHECKING:
     pass
 
@@ -31,7 +34,7 @@ class CorrelationKeyType(Enum):
     CONNECTION_ID = "connection_id"
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrelationConfig:
     """Configuration for the CorrelationEngine."""
 
@@ -40,7 +43,7 @@ class CorrelationConfig:
     enable_handle_tracking: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class CorrelationGroup:
     """A group of correlated events.
 
@@ -68,6 +71,106 @@ class CorrelationGroup:
         return None
 
 
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _event_timestamp(event: Any) -> int:
+    """Get the sort key used to order events on a timeline.
+
+    Keys are integer nanoseconds since the Unix epoch. Native events expose
+    this directly as ``timestamp_ns``; datetime timestamps are converted and
+    numeric ones are taken as seconds. Events without a timestamp sort first.
+    """
+    timestamp_ns = getattr(event, "timestamp_ns", None)
+    if type(timestamp_ns) is int:
+        return timestamp_ns
+
+    timestamp = getattr(event, "timestamp", None)
+    if isinstance(timestamp, datetime):
+        epoch = _EPOCH if timestamp.tzinfo is None else _EPOCH_UTC
+        return (timestamp - epoch) // _ONE_MICROSECOND * 1000
+    if isinstance(timestamp, (int, float)):
+        return int(timestamp * 1_000_000_000)
+    return 0
+
+
+class _TimelineBucket:
+    """Events sharing one correlation key, kept in timestamp order.
+
+    Events usually arrive in order, so adding one is an append; late
+    events are placed with a binary search on the parallel key array.
+    Evictions usually take the oldest event, so they only advance a start
+    offset, and the dead prefix is compacted once it fills half the arrays.
+    The exported columns are cached in the same layout and kept current
+    across appends and front evictions.
+    """
+
+    __slots__ = ("keys", "events", "start", "columns")
+
+    def __init__(self) -> None:
+        self.keys: array[int] = array("q")
+        self.events: list[Any] = []
+        # Entries before start have been evicted
+        self.start = 0
+        self.columns: dict[str, list[Any]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.events) - self.start
+
+    def live_events(self) -> list[Any]:
+        """Return a copy of the events in timestamp order."""
+        return self.events[self.start :]
+
+    def add(self, timestamp: int, event: Any) -> None:
+        """Insert an event after any events with the same timestamp."""
+        keys = self.keys
+        if len(keys) == self.start or timestamp >= keys[-1]:
+            keys.append(timestamp)
+            self.events.append(event)
+            columns = self.columns
+            if columns is not None:
+                columns["timestamp"].append(getattr(event, "timestamp", None))
+                columns["provider"].append(getattr(event, "provider_name", ""))
+                columns["event_id"].append(getattr(event, "event_id", 0))
+                columns["pid"].append(getattr(event, "process_id", 0))
+                columns["tid"].append(getattr(event, "thread_id", 0))
+        else:
+            i = bisect.bisect_right(keys, timestamp, self.start)
+            keys.insert(i, timestamp)
+            self.events.insert(i, event)
+            self.columns = None
+
+    def remove(self, timestamp: int, event: Any) -> None:
+        """Remove an event previously added with the given timestamp."""
+        keys = self.keys
+        events = self.events
+        start = self.start
+        if start < len(events) and events[start] is event:
+            # The oldest event: advance past it, compacting once half is dead
+            events[start] = None
+            start += 1
+            if start * 2 >= len(events):
+                del keys[:start]
+                del events[:start]
+                if self.columns is not None:
+                    for column in self.columns.values():
+                        del column[:start]
+                start = 0
+            self.start = start
+            return
+
+        for i in range(bisect.bisect_left(keys, timestamp, start), len(keys)):
+            if events[i] is event:
+                del keys[i]
+                del events[i]
+                self.columns = None
+                return
+            if keys[i] != timestamp:
+                return
+
+
 class CorrelationEngine:
     """Engine for correlating ETW events from multiple providers.
 
@@ -97,11 +200,28 @@ class CorrelationEngine:
         self._config = config or CorrelationConfig()
         self._providers: list[str] = []
         self._events: deque[Any] = deque()
-        self._event_id_counter = 0
-        # Use dict[int, event] for O(1) deletion instead of list
-        self._by_pid: dict[int, dict[int, Any]] = defaultdict(dict)
-        self._by_tid: dict[int, dict[int, Any]] = defaultdict(dict)
-        self._by_handle: dict[int, dict[int, Any]] = defaultdict(dict)
+        # Column-oriented copy of the exported fields, kept in step with _events
+        self._timestamp_col: deque[Any] = deque()
+        self._provider_col: deque[int] = deque()
+        self._event_id_col: deque[int] = deque()
+        self._pid_col: deque[int] = deque()
+        self._tid_col: deque[int] = deque()
+        # Provider names are stored once; the provider column holds their codes
+        self._provider_codes: dict[str, int] = {}
+        self._provider_names: list[str] = []
+        # Per-key buckets kept sorted by timestamp as events are added
+        self._by_pid: dict[int, _TimelineBucket] = {}
+        self._by_tid: dict[int, _TimelineBucket] = {}
+        self._by_handle: dict[int, _TimelineBucket] = {}
+        # Key type dispatch to the bound per-index lookups, under both the
+        # enum member and its string value so correlate() needs no conversion
+        self._lookups: dict[CorrelationKeyType | str, Callable[[Any], list[Any]]] = {}
+        for key_type, lookup in (
+            (CorrelationKeyType.PID, self.correlate_by_pid),
+            (CorrelationKeyType.TID, self.correlate_by_tid),
+            (CorrelationKeyType.HANDLE, self.correlate_by_handle),
+        ):
+            self._lookups[key_type] = self._lookups[key_type.value] = lookup
 
     @property
     def providers(self) -> list[str]:
@@ -131,68 +251,83 @@ class CorrelationEngine:
         Args:
             event: ETW event to add.
         """
-        # Assign internal ID for O(1) deletion
-        event_id = self._event_id_counter
-        self._event_id_counter += 1
-        event._correlation_id = event_id  # type: ignore[attr-defined]
+        max_events = self._config.max_events
+        if max_events <= 0:
+            return
+
+        # Evict the oldest event before appending so the engine never holds
+        # more than max_events, even transiently
+        while len(self._events) >= max_events:
+            self._evict_oldest()
 
         self._events.append(event)
+        timestamp = _event_timestamp(event)
 
-        # Index by PID
-        pid = getattr(event, "process_id", None)
-        if pid is not None:
-            self._by_pid[pid][event_id] = event
+        self._timestamp_col.append(getattr(event, "timestamp", None))
+        self._provider_col.append(self._provider_code(getattr(event, "provider_name", "")))
+        self._event_id_col.append(getattr(event, "event_id", 0))
+        self._pid_col.append(getattr(event, "process_id", 0))
+        self._tid_col.append(getattr(event, "thread_id", 0))
 
-        # Index by TID
-        tid = getattr(event, "thread_id", None)
-        if tid is not None:
-            self._by_tid[tid][event_id] = event
+        # Index by PID and TID
+        self._index(self._by_pid, getattr(event, "process_id", None), timestamp, event)
+        self._index(self._by_tid, getattr(event, "thread_id", None), timestamp, event)
 
         # Index by Handle if present
         if self._config.enable_handle_tracking:
             props = getattr(event, "properties", {})
             handle = props.get("handle") or props.get("Handle")
-            if handle is not None:
-                self._by_handle[handle][event_id] = event
-
-        # Trim if over max_events
-        if len(self._events) > self._config.max_events:
-            self._trim_events()
-
-    def _trim_events(self) -> None:
-        """Trim old events to stay within max_events limit (O(1) per event)."""
-        excess = len(self._events) - self._config.max_events
-        for _ in range(excess):
-            old_event = self._events.popleft()
-            event_id = getattr(old_event, "_correlation_id", None)
-            if event_id is None:
-                continue
+            self._index(self._by_handle, handle, timestamp, event)
+
+    def _provider_code(self, provider_name: str) -> int:
+        """Get the small-int code for a provider name, assigning one if new."""
+        code = self._provider_codes.get(provider_name)
+        if code is None:
+            code = self._provider_codes[provider_name] = len(self._provider_names)
+            self._provider_names.append(provider_name)
+        return code
+
+    def _evict_oldest(self) -> None:
+        """Drop the oldest event from the ring and from every index."""
+        old_event = self._events.popleft()
+        timestamp = _event_timestamp(old_event)
+
+        self._timestamp_col.popleft()
+        self._provider_col.popleft()
+        self._event_id_col.popleft()
+        self._pid_col.popleft()
+        self._tid_col.popleft()
+
+        # The oldest event is normally at the front of its buckets
+        self._unindex(self._by_pid, getattr(old_event, "process_id", None), timestamp, old_event)
+        self._unindex(self._by_tid, getattr(old_event, "thread_id", None), timestamp, old_event)
 
-            # O(1) deletion from indexes
-            pid = getattr(old_event, "process_id", None)
-            if pid is not None and event_id in self._by_pid.get(pid, {}):
-                del self._by_pid[pid][event_id]
-
-            tid = getattr(old_event, "thread_id", None)
-            if tid is not None and event_id in self._by_tid.get(tid, {}):
-                del self._by_tid[tid][event_id]
-
-            if self._config.enable_handle_tracking:
-                props = getattr(old_event, "properties", {})
-                handle = props.get("handle") or props.get("Handle")
-                if handle is not None and event_id in self._by_handle.get(handle, {}):
-                    del self._by_handle[handle][event_id]
-
-    def _sort_by_timestamp(self, events: list[Any]) -> list[Any]:
-        """Sort events by timestamp (common helper method).
-
-        Args:
-            events: List of events to sort.
-
-        Returns:
-            Sorted list of events.
-        """
-        return sorted(events, key=lambda e: getattr(e, "timestamp", datetime.min))
+        if self._config.enable_handle_tracking:
+            props = getattr(old_event, "properties", {})
+            handle = props.get("handle") or props.get("Handle")
+            self._unindex(self._by_handle, handle, timestamp, old_event)
+
+    @staticmethod
+    def _index(index: dict[Any, _TimelineBucket], key: Any, timestamp: int, event: Any) -> None:
+        """Add an event to the bucket for a key, creating it if needed."""
+        if key is None:
+            return
+        bucket = index.get(key)
+        if bucket is None:
+            bucket = index[key] = _TimelineBucket()
+        bucket.add(timestamp, event)
+
+    @staticmethod
+    def _unindex(index: dict[Any, _TimelineBucket], key: Any, timestamp: int, event: Any) -> None:
+        """Remove an event from an index, dropping the bucket once it is empty."""
+        if key is None:
+            return
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.remove(timestamp, event)
+        if not len(bucket):
+            del index[key]
 
     def correlate_by_pid(self, pid: int) -> list[Any]:
         """Get all events correlated by process ID.
@@ -203,8 +338,8 @@ class CorrelationEngine:
         Returns:
             List of events for the given PID, sorted by timestamp.
         """
-        events = list(self._by_pid.get(pid, {}).values())
-        return self._sort_by_timestamp(events)
+        bucket = self._by_pid.get(pid)
+        return bucket.live_events() if bucket else []
 
     def correlate_by_tid(self, tid: int) -> list[Any]:
         """Get all events correlated by thread ID.
@@ -215,8 +350,8 @@ class CorrelationEngine:
         Returns:
             List of events for the given TID, sorted by timestamp.
         """
-        events = list(self._by_tid.get(tid, {}).values())
-        return self._sort_by_timestamp(events)
+        bucket = self._by_tid.get(tid)
+        return bucket.live_events() if bucket else []
 
     def correlate_by_handle(self, handle: int) -> list[Any]:
         """Get all events correlated by handle.
@@ -227,22 +362,44 @@ class CorrelationEngine:
         Returns:
             List of events for the given handle, sorted by timestamp.
         """
-        events = list(self._by_handle.get(handle, {}).values())
-        return self._sort_by_timestamp(events)
+        bucket = self._by_handle.get(handle)
+        return bucket.live_events() if bucket else []
 
-    def correlated_groups(self) -> Iterator[CorrelationGroup]:
+    def correlate(self, key_type: CorrelationKeyType | str, value: Any) -> list[Any]:
+        """Get all events correlated by the given key type.
+
+        Args:
+            key_type: Key type to correlate on, as a member or its value (e.g. "pid").
+            value: Key value to look up.
+
+        Returns:
+            List of events for the given key, sorted by timestamp.
+
+        Raises:
+            ValueError: If the key type is not indexed by the engine.
+        """
+        lookup = self._lookups.get(key_type)
+        if lookup is None:
+            raise ValueError(f"Correlation by {key_type!s} is not supported")
+        return lookup(value)
+
+    def correlated_groups(self, min_group_size: int = 1) -> Iterator[CorrelationGroup]:
         """Get all correlation groups.
 
+        Args:
+            min_group_size: Skip PIDs with fewer events than this.
+
         Yields:
             CorrelationGroup objects for each unique PID.
         """
-        for pid, events_dict in self._by_pid.items():
-            if events_dict:
-                yield CorrelationGroup(
-                    key_type="pid",
-                    key_value=pid,
-                    events=list(events_dict.values()),
-                )
+        for pid, bucket in self._by_pid.items():
+            if len(bucket) < min_group_size:
+                continue
+            yield CorrelationGroup(
+                key_type="pid",
+                key_value=pid,
+                events=bucket.live_events(),
+            )
 
     def trace_causality(
         self,
@@ -258,31 +415,26 @@ class CorrelationEngine:
         Returns:
             List of causally related events.
         """
-        result = []
         pid = getattr(start_event, "process_id", None)
-        start_time = getattr(start_event, "timestamp", datetime.min)
-        target_lower = target_type.lower() if target_type else None
-
-        if pid is not None:
-            related = self._by_pid.get(pid, {}).values()
-            for event in related:
-                event_time = getattr(event, "timestamp", datetime.min)
-                # Only include events after the start event within time window
-                if event_time < start_time:
-                    continue
-
-                time_diff = (event_time - start_time).total_seconds() * 1000
-                if time_diff > self._config.time_window_ms:
-                    continue
-
-                if target_lower:
-                    provider = getattr(event, "provider_name", "").lower()
-                    if target_lower not in provider:
-                        continue
-
-                result.append(event)
-
-        return self._sort_by_timestamp(result)
+        bucket = self._by_pid.get(pid) if pid is not None else None
+        if bucket is None:
+            return []
+
+        # Bucket timestamps are sorted, so the window is a contiguous slice
+        start_time = _event_timestamp(start_event)
+        end_time = start_time + self._config.time_window_ms * 1_000_000
+        lo = bisect.bisect_left(bucket.keys, start_time, bucket.start)
+        hi = bisect.bisect_right(bucket.keys, end_time, lo)
+        window = bucket.events[lo:hi]
+
+        if not target_type:
+            return window
+
+        # Resolve the target against the provider table once, not per event;
+        # provider_name is optional on native events, so skip unnamed entries
+        target_lower = target_type.lower()
+        providers = {name for name in self._provider_names if name and target_lower in name.lower()}
+        return [event for event in window if getattr(event, "provider_name", "") in providers]
 
     def to_timeline_json(self, pid: int | None = None) -> str:
         """Export correlation data to timeline JSON.
@@ -293,21 +445,39 @@ class CorrelationEngine:
         Returns:
             JSON string representation of the timeline.
         """
-        events = self.correlate_by_pid(pid) if pid is not None else self._events
-
-        timeline = []
-        for event in events:
-            timeline.append(
-                {
-                    "timestamp": str(getattr(event, "timestamp", "")),
-                    "provider": getattr(event, "provider_name", ""),
-                    "event_id": getattr(event, "event_id", 0),
-                    "pid": getattr(event, "process_id", 0),
-                    "tid": getattr(event, "thread_id", 0),
-                }
+        if pid is None:
+            # Build rows straight from the maintained columns
+            rows = zip(
+                self._timestamp_col,
+                map(self._provider_names.__getitem__, self._provider_col),
+                self._event_id_col,
+                self._pid_col,
+                self._tid_col,
             )
+        else:
+            rows = (
+                (
+                    getattr(event, "timestamp", None),
+                    getattr(event, "provider_name", ""),
+                    getattr(event, "event_id", 0),
+                    getattr(event, "process_id", 0),
+                    getattr(event, "thread_id", 0),
+                )
+                for event in self.correlate_by_pid(pid)
+            )
+
+        timeline = [
+            {
+                "timestamp": "" if timestamp is None else str(timestamp),
+                "provider": provider,
+                "event_id": event_id,
+                "pid": event_pid,
+                "tid": tid,
+            }
+            for timestamp, provider, event_id, event_pid, tid in rows
+        ]
 
-        return json.dumps({"timeline": timeline}, indent=2)
+        return _json.dumps({"timeline": timeline}, indent=True)
 
     def to_dataframe(self, pid: int | None = None) -> dict[str, list[Any]]:
         """Export correlation data to DataFrame-compatible format.
@@ -318,21 +488,31 @@ class CorrelationEngine:
         Returns:
             Dictionary that can be converted to pandas DataFrame.
         """
-        events = self.correlate_by_pid(pid) if pid is not None else self._events
-
-        data: dict[str, list[Any]] = {
-            "timestamp": [],
-            "provider": [],
-            "event_id": [],
-            "pid": [],
-            "tid": [],
-        }
-
-        for event in events:
-            data["timestamp"].append(getattr(event, "timestamp", None))
-            data["provider"].append(getattr(event, "provider_name", ""))
-            data["event_id"].append(getattr(event, "event_id", 0))
-            data["pid"].append(getattr(event, "process_id", 0))
-            data["tid"].append(getattr(event, "thread_id", 0))
-
-        return data
+        if pid is None:
+            # Copy the maintained columns wholesale, no per-event access
+            return {
+                "timestamp": list(self._timestamp_col),
+                "provider": list(map(self._provider_names.__getitem__, self._provider_col)),
+                "event_id": list(self._event_id_col),
+                "pid": list(self._pid_col),
+                "tid": list(self._tid_col),
+            }
+
+        bucket = self._by_pid.get(pid)
+        if bucket is None:
+            return {"timestamp": [], "provider": [], "event_id": [], "pid": [], "tid": []}
+
+        # Build the bucket's columns once; appends and evictions keep them current
+        columns = bucket.columns
+        if columns is None:
+            events = bucket.events
+            columns = bucket.columns = {
+                "timestamp": [getattr(e, "timestamp", None) for e in events],
+                "provider": [getattr(e, "provider_name", "") for e in events],
+                "event_id": [getattr(e, "event_id", 0) for e in events],
+                "pid": [getattr(e, "process_id", 0) for e in events],
+                "tid": [getattr(e, "thread_id", 0) for e in events],
+            }
+
+        start = bucket.start
+        return {name: values[start:] for name, values in columns.items()}
@@ -6,7 +6,6 @@ enabling live ETW event monitoring in a browser-based UI.
 
 from __future__ import annotations
 
-import json
 import logging
 import threading
 import time
@@ -16,13 +15,18 @@ from datetime import datetime
 from itertools import islice
 from typing import TYPE_CHECKING, Any
 
+from pyetwkit import _json
+
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+# How often the writer thread formats buffered events, in seconds
+_WRITER_INTERVAL_S = 0.1
 
-@dataclass
+
+@dataclass(slots=True)
 class DashboardConfig:
     """Configuration for the Dashboard server."""
 
@@ -57,14 +61,14 @@ class EventSerializer:
         "properties": {},
     }
 
-    def serialize(self, event: Any) -> str:
-        """Serialize a single event to JSON.
+    def to_dict(self, event: Any) -> dict[str, Any]:
+        """Extract the serialized fields of an event into a plain dict.
 
         Args:
-            event: The ETW event to serialize.
+            event: The ETW event to convert.
 
         Returns:
-            JSON string representation of the event.
+            Dictionary ready for JSON encoding.
         """
         timestamp = getattr(event, "timestamp", 0.0)
         if hasattr(timestamp, "isoformat"):
@@ -73,23 +77,44 @@ class EventSerializer:
         # Extract attributes using mapping
         data = {key: getattr(event, key, default) for key, default in self._ATTR_DEFAULTS.items()}
         data["timestamp"] = timestamp
-        return json.dumps(data)
+        return data
+
+    def serialize(self, event: Any) -> str:
+        """Serialize a single event to JSON.
+
+        Args:
+            event: The ETW event to serialize.
+
+        Returns:
+            JSON string representation of the event.
+        """
+        return _json.dumps(self.to_dict(event))
 
     def serialize_batch(self, events: list[Any]) -> str:
         """Serialize a batch of events to JSON.
 
+        The events are converted to dicts first and encoded in a single call,
+        rather than round-tripping each event through its own JSON string.
+
         Args:
             events: List of ETW events to serialize.
 
         Returns:
             JSON string with events array.
         """
-        data = {"events": [json.loads(self.serialize(e)) for e in events]}
-        return json.dumps(data)
+        to_dict = self.to_dict
+        return _json.dumps({"events": [to_dict(e) for e in events]})
 
 
 class EventBuffer:
-    """Thread-safe buffer for ETW events."""
+    """Thread-safe buffer for ETW events.
+
+    Producers append raw events to a pending list without taking the lock;
+    readers drain the pending events into the bounded history under the
+    lock, formatting the whole batch at once. Appending to and slicing a
+    list are atomic, so no event is lost between a producer and a
+    concurrent drain.
+    """
 
     def __init__(self, max_size: int = 1000) -> None:
         """Initialize the event buffer.
@@ -97,7 +122,9 @@ class EventBuffer:
         Args:
             max_size: Maximum number of events to store.
         """
+        self._max_size = max_size
         self._events: deque[dict[str, Any]] = deque(maxlen=max_size)
+        self._pending: list[Any] = []
         self._lock = threading.Lock()
         self._event_count = 0
         self._last_second_count = 0
@@ -110,10 +137,21 @@ class EventBuffer:
         Args:
             event: ETW event to add.
         """
+        pending = self._pending
+        pending.append(event)
+
+        # Drain from the producer side too when nobody is reading
+        if len(pending) >= self._max_size:
+            with self._lock:
+                self._drain()
+
+    @staticmethod
+    def _format_event(event: Any) -> dict[str, Any]:
+        """Convert an event into the row shown by the dashboard."""
         timestamp = getattr(event, "timestamp", datetime.now())
         timestamp_str = timestamp.isoformat() if hasattr(timestamp, "isoformat") else str(timestamp)
 
-        event_dict = {
+        return {
             "timestamp": timestamp_str,
             "provider": getattr(event, "provider_name", "Unknown"),
             "event_id": getattr(event, "event_id", 0),
@@ -122,17 +160,29 @@ class EventBuffer:
             "properties": str(getattr(event, "properties", {}))[:100],
         }
 
+    def _drain(self) -> None:
+        """Move pending events into the history. Caller must hold the lock."""
+        pending = self._pending
+        count = len(pending)
+        if count:
+            # Only the newest max_size events survive, so skip formatting the rest
+            batch = pending[max(count - self._max_size, 0) : count]
+            del pending[:count]
+            self._events.extend(map(self._format_event, batch))
+            self._event_count += count
+            self._last_second_count += count
+
+        # Update rate calculation
+        now = time.time()
+        if now - self._last_rate_time >= 1.0:
+            self._events_per_second = self._last_second_count / (now - self._last_rate_time)
+            self._last_second_count = 0
+            self._last_rate_time = now
+
+    def flush(self) -> None:
+        """Format pending events into the history now."""
         with self._lock:
-            self._events.append(event_dict)
-            self._event_count += 1
-            self._last_second_count += 1
-
-            # Update rate calculation
-            now = time.time()
-            if now - self._last_rate_time >= 1.0:
-                self._events_per_second = self._last_second_count / (now - self._last_rate_time)
-                self._last_second_count = 0
-                self._last_rate_time = now
+            self._drain()
 
     def get_events(self, limit: int = 100) -> list[dict[str, Any]]:
         """Get recent events efficiently.
@@ -144,6 +194,7 @@ class EventBuffer:
             List of event dictionaries.
         """
         with self._lock:
+            self._drain()
             event_count = len(self._events)
             if event_count <= limit:
                 return list(self._events)
@@ -158,6 +209,7 @@ class EventBuffer:
             Dictionary with statistics.
         """
         with self._lock:
+            self._drain()
             return {
                 "total_events": self._event_count,
                 "buffer_size": len(self._events),
@@ -167,6 +219,7 @@ class EventBuffer:
     def clear(self) -> None:
         """Clear the buffer."""
         with self._lock:
+            del self._pending[: len(self._pending)]
             self._events.clear()
             self._event_count = 0
 
@@ -203,6 +256,7 @@ class Dashboard:
         self._event_buffer = EventBuffer(self._config.event_buffer_size)
         self._session: Any = None
         self._session_thread: threading.Thread | None = None
+        self._writer_thread: threading.Thread | None = None
         self._stop_event = threading.Event()
 
     @property
@@ -375,6 +429,7 @@ class Dashboard:
 
         app = self._create_gradio_app()
         self._is_running = True
+        self._start_writer()
 
         app.launch(
             server_name=self._host,
@@ -401,8 +456,27 @@ class Dashboard:
         """
         self._is_running = False
         self._stop_event.set()
+        writer = self._writer_thread
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout=1.0)
+        self._writer_thread = None
         return self
 
+    def _start_writer(self) -> None:
+        """Start the background thread that formats buffered events."""
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="dashboard-writer", daemon=True
+        )
+        self._writer_thread.start()
+
+    def _writer_loop(self) -> None:
+        """Periodically drain the event buffer until the dashboard stops."""
+        while not self._stop_event.wait(_WRITER_INTERVAL_S):
+            self._event_buffer.flush()
+
     def broadcast_event(self, event: Any) -> None:
         """Add an event to the dashboard (alias for add_event).
 
@@ -421,6 +495,13 @@ class Dashboard:
         return False
 
 
+# Messages share a fixed envelope; only the payload is encoded per call
+_EVENT_PREFIX = '{"type":"event","payload":'
+_STATS_PREFIX = '{"type":"stats","payload":'
+_ERROR_PREFIX = '{"type":"error","payload":'
+_MESSAGE_SUFFIX = "}"
+
+
 def create_event_message(
     event_id: int,
     provider: str,
@@ -438,17 +519,13 @@ def create_event_message(
     Returns:
         JSON message string.
     """
-    return json.dumps(
-        {
-            "type": "event",
-            "payload": {
-                "event_id": event_id,
-                "provider": provider,
-                "timestamp": timestamp,
-                "properties": properties,
-            },
-        }
-    )
+    payload = {
+        "event_id": event_id,
+        "provider": provider,
+        "timestamp": timestamp,
+        "properties": properties,
+    }
+    return _EVENT_PREFIX + _json.dumps(payload) + _MESSAGE_SUFFIX
 
 
 def create_stats_message(
@@ -466,16 +543,12 @@ def create_stats_message(
     Returns:
         JSON message string.
     """
-    return json.dumps(
-        {
-            "type": "stats",
-            "payload": {
-                "events_per_second": events_per_second,
-                "total_events": total_events,
-                "active_providers": active_providers,
-            },
-        }
-    )
+    payload = {
+        "events_per_second": events_per_second,
+        "total_events": total_events,
+        "active_providers": active_providers,
+    }
+    return _STATS_PREFIX + _json.dumps(payload) + _MESSAGE_SUFFIX
 
 
 def create_error_message(message: str) -> str:
@@ -487,14 +560,7 @@ def create_error_message(message: str) -> str:
     Returns:
         JSON message string.
     """
-    return json.dumps(
-        {
-            "type": "error",
-            "payload": {
-                "message": message,
-            },
-        }
-    )
+    return _ERROR_PREFIX + _json.dumps({"message": message}) + _MESSAGE_SUFFIX
 
 
 # Keep old classes for backward compatibility
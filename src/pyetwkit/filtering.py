@@ -40,9 +40,8 @@ class FilterRule:
         elif self.field == "opcode":
             actual = event.opcode
         else:
-            # Check in properties
-            props = event.to_dict().get("properties", {})
-            actual = props.get(self.field)
+            # Check in properties, converting only the one value
+            actual = event.get(self.field)
 
         if actual is None:
             result = False
@@ -88,6 +88,12 @@ class MultiSession:
         if session_name is None:
             session_name = f"{self._name_prefix}-{uuid.uuid4().hex[:8]}"
 
+        # Parse the GUID first so an invalid one fails before a session is
+        # created - provider must be a GUID string
+        etw_provider = EtwProvider(provider).level(level)
+        etw_provider = etw_provider.keywords_any(keywords_any)
+        etw_provider = etw_provider.keywords_all(keywords_all)
+
         with self._lock:
             if session_name not in self._sessions:
                 session = EtwSession(session_name)
@@ -98,11 +104,6 @@ class MultiSession:
                     providers=[],
                 )
 
-            # Add provider to session - provider must be a GUID string
-            etw_provider = EtwProvider(provider).level(level)
-            etw_provider = etw_provider.keywords_any(keywords_any)
-            etw_provider = etw_provider.keywords_all(keywords_all)
-
             self._sessions[session_name].add_provider(etw_provider)
             self._session_info[session_name].providers.append(provider)
 
@@ -6,14 +6,51 @@ such as audio, network, GPU, and process monitoring.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import os
+from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
 
+@cache
+def _yaml_loader() -> tuple[Any, type]:
+    """Import PyYAML on first use and pick its fastest safe loader."""
+    import yaml
 
-@dataclass
+    # Prefer the libyaml-backed loader; PyYAML builds without libyaml only ship SafeLoader
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader  # type: ignore[assignment]
+
+    return yaml, loader
+
+
+# Trace level names accepted in profiles and by the CLI, mapped to their
+# TRACE_LEVEL_* values
+TRACE_LEVELS: dict[str, int] = {
+    "critical": 1,
+    "error": 2,
+    "warning": 3,
+    "information": 4,
+    "informational": 4,
+    "info": 4,
+    "verbose": 5,
+}
+
+
+def _normalize_level(level: str | int) -> int:
+    """Convert a level name or number to its numeric trace level."""
+    if isinstance(level, int):
+        return level
+    try:
+        return TRACE_LEVELS[level.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown trace level: {level!r}") from None
+
+
+@dataclass(frozen=True, slots=True)
 class ProviderConfig:
     """Configuration for a single ETW provider within a profile."""
 
@@ -29,6 +66,11 @@ class ProviderConfig:
     keywords: int | None = None
     """Keywords bitmask for filtering events."""
 
+    @property
+    def level_value(self) -> int:
+        """Numeric trace level (1-5) for this provider."""
+        return _normalize_level(self.level)
+
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ProviderConfig:
         """Create ProviderConfig from dictionary."""
@@ -40,7 +82,7 @@ class ProviderConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Profile:
     """A provider profile containing multiple provider configurations."""
 
@@ -50,16 +92,23 @@ class Profile:
     description: str = ""
     """Profile description."""
 
-    providers: list[ProviderConfig] = field(default_factory=list)
-    """List of provider configurations."""
+    providers: tuple[ProviderConfig, ...] = ()
+    """Provider configurations.
+
+    Any iterable is accepted and stored as a tuple, so a profile cannot be
+    changed through the sequence it was built from and can be hashed.
+    """
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "providers", tuple(self.providers))
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Profile:
         """Create Profile from dictionary."""
-        providers = [
+        providers = tuple(
             ProviderConfig.from_dict(p) if isinstance(p, dict) else p
             for p in data.get("providers", [])
-        ]
+        )
         return cls(
             name=data.get("name", ""),
             description=data.get("description", ""),
@@ -69,143 +118,132 @@ class Profile:
     @classmethod
     def from_yaml(cls, yaml_str: str) -> Profile:
         """Create Profile from YAML string."""
-        data = yaml.safe_load(yaml_str)
+        yaml, loader = _yaml_loader()
+        data = yaml.load(yaml_str, Loader=loader)
         return cls.from_dict(data)
 
 
-# Built-in profiles
-_BUILTIN_PROFILES: dict[str, Profile] = {}
-
-
-def _init_builtin_profiles() -> None:
-    """Initialize built-in profiles."""
-    global _BUILTIN_PROFILES
-
-    # Audio profile
-    _BUILTIN_PROFILES["audio"] = Profile(
-        name="audio",
-        description="Audio-related providers (WASAPI, Media Foundation, Audio)",
-        providers=[
-            ProviderConfig(
-                name="Microsoft-Windows-Audio",
-                guid="ae4bd3be-f36f-45b6-8d21-bdd6fb832853",
-                level="verbose",
+# Built-in profiles, keyed by name; load_profile() and register_profile() add to it
+_BUILTIN_PROFILES: dict[str, Profile] = {
+    profile.name: profile
+    for profile in (
+        # Audio profile
+        Profile(
+            name="audio",
+            description="Audio-related providers (WASAPI, Media Foundation, Audio)",
+            providers=(
+                ProviderConfig(
+                    name="Microsoft-Windows-Audio",
+                    guid="ae4bd3be-f36f-45b6-8d21-bdd6fb832853",
+                    level="verbose",
+                ),
+                ProviderConfig(
+                    name="Microsoft-Windows-MediaFoundation-Platform",
+                    guid="bc97b970-d001-482f-8745-b8d7d5759f99",
+                    level="information",
+                ),
+                ProviderConfig(
+                    name="Microsoft-Windows-MMCSS",
+                    guid="36008301-e154-466c-acec-5f4cbd6b4694",
+                    level="verbose",
+                ),
             ),
-            ProviderConfig(
-                name="Microsoft-Windows-MediaFoundation-Platform",
-                guid="bc97b970-d001-482f-8745-b8d7d5759f99",
-                level="information",
+        ),
+        # Network profile
+        Profile(
+            name="network",
+            description="Network-related providers (TCP/IP, DNS, NDIS)",
+            providers=(
+                ProviderConfig(
+                    name="Microsoft-Windows-TCPIP",
+                    guid="2f07e2ee-15db-40f1-90ef-9d7ba282188a",
+                    level="information",
+                ),
+                ProviderConfig(
+                    name="Microsoft-Windows-DNS-Client",
+                    guid="1c95126e-7eea-49a9-a3fe-a378b03ddb4d",
+                    level="information",
+                ),
+                ProviderConfig(
+                    name="Microsoft-Windows-NDIS",
+                    guid="cdead503-17f5-4a3e-b7ae-df8cc2902eb9",
+                    level="information",
+                ),
             ),
-            ProviderConfig(
-                name="Microsoft-Windows-MMCSS",
-                guid="36008301-e154-466c-acec-5f4cbd6b4694",
-                level="verbose",
+        ),
+        # GPU profile
+        Profile(
+            name="gpu",
+            description="GPU-related providers (DXGI, D3D, DWM)",
+            providers=(
+                ProviderConfig(
+                    name="Microsoft-Windows-DXGI",
+                    guid="ca11c036-0102-4a2d-a6ad-f03cfed5d3c9",
+                    level="information",
+                ),
+                ProviderConfig(
+                    name="Microsoft-Windows-D3D9",
+                    guid="783aca0a-790e-4d7f-8451-aa850511c6b9",
+                    level="information",
+                ),
+                ProviderConfig(
+                    name="Microsoft-Windows-Dwm-Core",
+                    guid="9e9bba3c-2e38-40cb-99f4-9e8281425164",
+                    level="information",
+                ),
             ),
-        ],
-    )
-
-    # Network profile
-    _BUILTIN_PROFILES["network"] = Profile(
-        name="network",
-        description="Network-related providers (TCP/IP, DNS, NDIS)",
-        providers=[
-            ProviderConfig(
-                name="Microsoft-Windows-TCPIP",
-                guid="2f07e2ee-15db-40f1-90ef-9d7ba282188a",
-                level="information",
+        ),
+        # Process profile
+        Profile(
+            name="process",
+            description="Process-related providers (Kernel-Process)",
+            providers=(
+                ProviderConfig(
+                    name="Microsoft-Windows-Kernel-Process",
+                    guid="22fb2cd6-0e7b-422b-a0c7-2fad1fd0e716",
+                    level="information",
+                    keywords=0x10,  # WINEVENT_KEYWORD_PROCESS
+                ),
             ),
-            ProviderConfig(
-                name="Microsoft-Windows-DNS-Client",
-                guid="1c95126e-7eea-49a9-a3fe-a378b03ddb4d",
-                level="information",
+        ),
+        # File I/O profile
+        Profile(
+            name="file",
+            description="File I/O related providers",
+            providers=(
+                ProviderConfig(
+                    name="Microsoft-Windows-Kernel-File",
+                    guid="edd08927-9cc4-4e65-b970-c2560fb5c289",
+                    level="information",
+                ),
             ),
-            ProviderConfig(
-                name="Microsoft-Windows-NDIS",
-                guid="cdead503-17f5-4a3e-b7ae-df8cc2902eb9",
-                level="information",
+        ),
+        # Security profile
+        Profile(
+            name="security",
+            description="Security-related providers",
+            providers=(
+                ProviderConfig(
+                    name="Microsoft-Windows-Security-Auditing",
+                    guid="54849625-5478-4994-a5ba-3e3b0328c30d",
+                    level="information",
+                ),
             ),
-        ],
-    )
-
-    # GPU profile
-    _BUILTIN_PROFILES["gpu"] = Profile(
-        name="gpu",
-        description="GPU-related providers (DXGI, D3D, DWM)",
-        providers=[
-            ProviderConfig(
-                name="Microsoft-Windows-DXGI",
-                guid="ca11c036-0102-4a2d-a6ad-f03cfed5d3c9",
-                level="information",
+        ),
+        # PowerShell profile
+        Profile(
+            name="powershell",
+            description="PowerShell-related providers",
+            providers=(
+                ProviderConfig(
+                    name="Microsoft-Windows-PowerShell",
+                    guid="a0c1853b-5c40-4b15-8766-3cf1c58f985a",
+                    level="verbose",
+                ),
             ),
-            ProviderConfig(
-                name="Microsoft-Windows-D3D9",
-                guid="783aca0a-790e-4d7f-8451-aa850511c6b9",
-                level="information",
-            ),
-            ProviderConfig(
-                name="Microsoft-Windows-Dwm-Core",
-                guid="9e9bba3c-2e38-40cb-99f4-9e8281425164",
-                level="information",
-            ),
-        ],
-    )
-
-    # Process profile
-    _BUILTIN_PROFILES["process"] = Profile(
-        name="process",
-        description="Process-related providers (Kernel-Process)",
-        providers=[
-            ProviderConfig(
-                name="Microsoft-Windows-Kernel-Process",
-                guid="22fb2cd6-0e7b-422b-a0c7-2fad1fd0e716",
-                level="information",
-                keywords=0x10,  # WINEVENT_KEYWORD_PROCESS
-            ),
-        ],
-    )
-
-    # File I/O profile
-    _BUILTIN_PROFILES["file"] = Profile(
-        name="file",
-        description="File I/O related providers",
-        providers=[
-            ProviderConfig(
-                name="Microsoft-Windows-Kernel-File",
-                guid="edd08927-9cc4-4e65-b970-c2560fb5c289",
-                level="information",
-            ),
-        ],
-    )
-
-    # Security profile
-    _BUILTIN_PROFILES["security"] = Profile(
-        name="security",
-        description="Security-related providers",
-        providers=[
-            ProviderConfig(
-                name="Microsoft-Windows-Security-Auditing",
-                guid="54849625-5478-4994-a5ba-3e3b0328c30d",
-                level="information",
-            ),
-        ],
-    )
-
-    # PowerShell profile
-    _BUILTIN_PROFILES["powershell"] = Profile(
-        name="powershell",
-        description="PowerShell-related providers",
-        providers=[
-            ProviderConfig(
-                name="Microsoft-Windows-PowerShell",
-                guid="a0c1853b-5c40-4b15-8766-3cf1c58f985a",
-                level="verbose",
-            ),
-        ],
+        ),
     )
-
-
-# Initialize built-in profiles
-_init_builtin_profiles()
+}
 
 
 def get_profile(name: str) -> Profile | None:
@@ -253,8 +291,9 @@ def load_profile(path: str | Path) -> Profile:
         >>> profile = load_profile("my_profile.yaml")
     """
     path = Path(path)
-    yaml_content = path.read_text(encoding="utf-8")
-    profile = Profile.from_yaml(yaml_content)
+    stat = path.stat()
+    # Keyed on mtime/size so an edited file is parsed again
+    profile = _load_profile_cached(os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
 
     # Register the loaded profile
     _BUILTIN_PROFILES[profile.name] = profile
@@ -262,6 +301,13 @@ def load_profile(path: str | Path) -> Profile:
     return profile
 
 
+@lru_cache(maxsize=128)
+def _load_profile_cached(path: str, mtime_ns: int, size: int) -> Profile:  # noqa: ARG001
+    """Read and parse a profile file; the stat fields only key the cache."""
+    yaml_content = Path(path).read_text(encoding="utf-8")
+    return Profile.from_yaml(yaml_content)
+
+
 def register_profile(profile: Profile) -> None:
     """Register a custom profile.
 
@@ -277,6 +323,7 @@ def register_profile(profile: Profile) -> None:
 
 
 __all__ = [
+    "TRACE_LEVELS",
     "Profile",
     "ProviderConfig",
     "get_profile",
@@ -3,6 +3,10 @@ Pre-configured ETW providers for common use cases.
 
 These providers come with sensible defaults and are ready to use
 without needing to know specific GUIDs or keywords.
+
+Providers with a native factory (kernel process, DNS client, PowerShell)
+are built from the extension's compile-time GUID constants rather than by
+parsing the GUID string on every call.
 """
 
 from __future__ import annotations
@@ -32,7 +36,7 @@ class KernelProvider:
         """
         from pyetwkit._core import EtwProvider
 
-        return EtwProvider(cls.KERNEL_PROCESS, "Microsoft-Windows-Kernel-Process")
+        return EtwProvider.kernel_process()
 
     @classmethod
     def file(cls) -> EtwProvider:
@@ -68,7 +72,7 @@ class KernelProvider:
 class ProcessProvider:
     """Factory for process-related ETW providers."""
 
-    PROCESS_GUID = "22fb2cd6-0e7b-422b-a0c7-2fad1fd0e716"
+    PROCESS_GUID = KernelProvider.KERNEL_PROCESS
 
     # Event IDs
     PROCESS_START = 1
@@ -83,14 +87,14 @@ class ProcessProvider:
         """Create a provider for all process events."""
         from pyetwkit._core import EtwProvider
 
-        return EtwProvider(cls.PROCESS_GUID, "Microsoft-Windows-Kernel-Process")
+        return EtwProvider.kernel_process()
 
     @classmethod
     def process_lifecycle(cls) -> EtwProvider:
         """Create a provider for process start/stop events only."""
         from pyetwkit._core import EtwProvider
 
-        provider = EtwProvider(cls.PROCESS_GUID, "Microsoft-Windows-Kernel-Process")
+        provider = EtwProvider.kernel_process()
         return provider.event_ids([cls.PROCESS_START, cls.PROCESS_STOP])
 
     @classmethod
@@ -98,7 +102,7 @@ class ProcessProvider:
         """Create a provider for DLL/image load events only."""
         from pyetwkit._core import EtwProvider
 
-        provider = EtwProvider(cls.PROCESS_GUID, "Microsoft-Windows-Kernel-Process")
+        provider = EtwProvider.kernel_process()
         return provider.event_ids([cls.IMAGE_LOAD, cls.IMAGE_UNLOAD])
 
 
@@ -114,7 +118,7 @@ class NetworkProvider:
         """Create a provider for DNS query events."""
         from pyetwkit._core import EtwProvider
 
-        return EtwProvider(cls.DNS_CLIENT, "Microsoft-Windows-DNS-Client")
+        return EtwProvider.dns_client()
 
     @classmethod
     def tcpip(cls) -> EtwProvider:
@@ -134,7 +138,7 @@ class NetworkProvider:
 class FileProvider:
     """Factory for file-related ETW providers."""
 
-    KERNEL_FILE = "edd08927-9cc4-4e65-b970-c2560fb5c289"
+    KERNEL_FILE = KernelProvider.KERNEL_FILE
     NTFS = "dd70bc80-ef44-421b-8ac3-cd31da613a4e"
 
     @classmethod
@@ -155,7 +159,7 @@ class FileProvider:
 class RegistryProvider:
     """Factory for registry-related ETW providers."""
 
-    KERNEL_REGISTRY = "70eb4f03-c1de-4f73-a051-33d13d5413bd"
+    KERNEL_REGISTRY = KernelProvider.KERNEL_REGISTRY
 
     @classmethod
     def all(cls) -> EtwProvider:
@@ -200,7 +204,7 @@ class PowerShellProvider:
         """Create a provider for all PowerShell events."""
         from pyetwkit._core import EtwProvider
 
-        return EtwProvider(cls.POWERSHELL, "Microsoft-Windows-PowerShell")
+        return EtwProvider.powershell()
 
 
 class DotNetProvider:
@@ -9,18 +9,47 @@ from __future__ import annotations
 import bisect
 import json
 import logging
+import os
+import stat
+import tempfile
+from array import array
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from pyetwkit import _json
+
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+# Number of events encoded per encoder call when writing a recording
+_WRITE_BATCH_SIZE = 1024
+
+
+def _nest(text: str) -> str:
+    """Indent every line after the first of indented JSON by one more level."""
+    return text.replace("\n", "\n  ")
+
+
+def _new_file_mode(path: Path) -> int:
+    """Return the permission bits a rewrite of path should carry.
+
+    An existing file keeps its mode. A new file gets the mode open() would
+    give it under the current umask.
+    """
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
 
 class CompressionType(Enum):
     """Compression types for .etwpack files."""
@@ -30,7 +59,7 @@ class CompressionType(Enum):
     LZ4 = "lz4"
 
 
-@dataclass
+@dataclass(slots=True)
 class RecorderConfig:
     """Configuration for the Recorder."""
 
@@ -39,7 +68,7 @@ class RecorderConfig:
     buffer_size: int = 1024 * 64  # 64KB
 
 
-@dataclass
+@dataclass(slots=True)
 class EtwpackHeader:
     """Header for .etwpack files."""
 
@@ -51,36 +80,40 @@ class EtwpackHeader:
     compression: str = "zstd"
     schema_version: int = 1
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert header to a JSON-compatible dictionary.
+
+        Returns:
+            Dictionary representation.
+        """
+        return {
+            "version": self.version,
+            "created_at": self.created_at,
+            "provider_guids": self.provider_guids,
+            "event_count": self.event_count,
+            "duration_ms": self.duration_ms,
+            "compression": self.compression,
+            "schema_version": self.schema_version,
+        }
+
     def to_json(self) -> str:
         """Serialize header to JSON.
 
         Returns:
             JSON string representation.
         """
-        return json.dumps(
-            {
-                "version": self.version,
-                "created_at": self.created_at,
-                "provider_guids": self.provider_guids,
-                "event_count": self.event_count,
-                "duration_ms": self.duration_ms,
-                "compression": self.compression,
-                "schema_version": self.schema_version,
-            },
-            indent=2,
-        )
+        return _json.dumps(self.to_dict(), indent=True)
 
     @classmethod
-    def from_json(cls, json_str: str) -> EtwpackHeader:
-        """Deserialize header from JSON.
+    def from_dict(cls, data: dict[str, Any]) -> EtwpackHeader:
+        """Create header from a dictionary.
 
         Args:
-            json_str: JSON string.
+            data: Dictionary as produced by to_dict().
 
         Returns:
             EtwpackHeader instance.
         """
-        data = json.loads(json_str)
         return cls(
             version=data["version"],
             created_at=data["created_at"],
@@ -91,8 +124,20 @@ class EtwpackHeader:
             schema_version=data.get("schema_version", 1),
         )
 
+    @classmethod
+    def from_json(cls, json_str: str) -> EtwpackHeader:
+        """Deserialize header from JSON.
 
-@dataclass
+        Args:
+            json_str: JSON string.
+
+        Returns:
+            EtwpackHeader instance.
+        """
+        return cls.from_dict(_json.loads(json_str))
+
+
+@dataclass(slots=True)
 class EtwpackChunk:
     """A chunk of events in .etwpack format."""
 
@@ -104,11 +149,16 @@ class EtwpackChunk:
 
 
 class EtwpackIndex:
-    """Index for fast seeking in .etwpack files."""
+    """Index for fast seeking in .etwpack files.
+
+    Entries are kept as two parallel arrays in timestamp order, so lookups
+    are a single bisect over packed doubles.
+    """
 
     def __init__(self) -> None:
         """Initialize the index."""
-        self._entries: list[tuple[float, int]] = []  # (timestamp, offset)
+        self._timestamps = array("d")
+        self._offsets = array("q")
 
     def add_entry(self, timestamp: float, offset: int) -> None:
         """Add an index entry.
@@ -117,7 +167,8 @@ class EtwpackIndex:
             timestamp: Event timestamp.
             offset: File offset.
         """
-        self._entries.append((timestamp, offset))
+        self._timestamps.append(timestamp)
+        self._offsets.append(offset)
 
     def find_offset(self, timestamp: float) -> int | None:
         """Find the file offset for a timestamp.
@@ -126,21 +177,14 @@ class EtwpackIndex:
             timestamp: Target timestamp.
 
         Returns:
-            File offset or None if not found.
+            Offset of the first entry at or after the timestamp (the last
+            entry if all are earlier), or None if the index is empty.
         """
-        if not self._entries:
+        if not self._offsets:
             return None
 
-        # Binary search for closest entry
-        left, right = 0, len(self._entries) - 1
-        while left < right:
-            mid = (left + right) // 2
-            if self._entries[mid][0] < timestamp:
-                left = mid + 1
-            else:
-                right = mid
-
-        return self._entries[left][1] if left < len(self._entries) else None
+        i = bisect.bisect_left(self._timestamps, timestamp)
+        return self._offsets[min(i, len(self._offsets) - 1)]
 
 
 class Recorder:
@@ -260,21 +304,49 @@ class Recorder:
                 return ts.isoformat()
             return ts
 
-        data = {
-            "header": json.loads(header.to_json()),
-            "events": [
-                {
-                    "event_id": getattr(e, "event_id", 0),
-                    "provider_name": getattr(e, "provider_name", ""),
-                    "timestamp": serialize_timestamp(getattr(e, "timestamp", 0)),
-                    "process_id": getattr(e, "process_id", 0),
-                    "properties": getattr(e, "properties", {}),
-                }
-                for e in self._events
-            ],
-        }
-
-        self._output_path.write_text(json.dumps(data, indent=2))
+        def to_record(e: Any) -> dict[str, Any]:
+            return {
+                "event_id": getattr(e, "event_id", 0),
+                "provider_name": getattr(e, "provider_name", ""),
+                "timestamp": serialize_timestamp(getattr(e, "timestamp", 0)),
+                "process_id": getattr(e, "process_id", 0),
+                "properties": getattr(e, "properties", {}),
+            }
+
+        # Stream the document through a buffer_size write buffer, encoding
+        # events a batch at a time with one encoder call per batch. Write to a
+        # sibling temp file so a failed encode never leaves a truncated file
+        # or clobbers an earlier recording at the output path. The layout
+        # matches a single indented dump of the whole document.
+        events = self._events
+        output_path = self._output_path
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            buffering=self._config.buffer_size,
+            dir=output_path.parent,
+            prefix=f".{output_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            try:
+                f.write('{\n  "header": ')
+                f.write(_nest(_json.dumps(header.to_dict(), indent=True)))
+                f.write(',\n  "events": [\n')
+                for start in range(0, len(events), _WRITE_BATCH_SIZE):
+                    batch = [to_record(e) for e in events[start : start + _WRITE_BATCH_SIZE]]
+                    if start:
+                        f.write(",\n")
+                    # Strip the enclosing bracket lines so batches join into one array
+                    f.write("  " + _nest(_json.dumps(batch, indent=True)[2:-2]))
+                f.write("\n  ]\n}\n")
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        # The temp file is created 0600; give the recording the usual mode
+        os.chmod(f.name, _new_file_mode(output_path))
+        os.replace(f.name, output_path)
 
     def __enter__(self) -> Recorder:
         """Context manager entry."""
@@ -319,8 +391,8 @@ class Player:
             return
 
         try:
-            data = json.loads(self._input_path.read_text(encoding="utf-8"))
-            self._header = EtwpackHeader.from_json(json.dumps(data["header"]))
+            data = _json.load_file(self._input_path)
+            self._header = EtwpackHeader.from_dict(data["header"])
             self._events = data.get("events", [])
             self.duration = self._header.duration_ms / 1000.0
             self.event_count = self._header.event_count
@@ -379,18 +451,18 @@ class Player:
         Yields:
             Event dictionaries.
         """
-        for event in self._events[self._position :]:
-            # Apply filters
-            if provider and event.get("provider_name") != provider:
-                continue
-            if event_id is not None and event.get("event_id") != event_id:
-                continue
-            if start_time and event.get("timestamp", 0) < start_time:
-                continue
-            if end_time and event.get("timestamp", 0) > end_time:
-                continue
+        # Chain only the filters that are set; with none, iteration stays in C
+        events: Iterator[dict[str, Any]] = islice(self._events, self._position, None)
+        if provider:
+            events = (e for e in events if e.get("provider_name") == provider)
+        if event_id is not None:
+            events = (e for e in events if e.get("event_id") == event_id)
+        if start_time:
+            events = (e for e in events if e.get("timestamp", 0) >= start_time)
+        if end_time:
+            events = (e for e in events if e.get("timestamp", 0) <= end_time)
 
-            yield event
+        yield from events
 
 
 def convert_etl_to_etwpack(
@@ -422,9 +494,9 @@ def convert_etl_to_etwpack(
         compression=compression.value,
     )
 
-    data = {"header": json.loads(header.to_json()), "events": []}
+    data = {"header": header.to_dict(), "events": []}
 
-    etwpack_path.write_text(json.dumps(data, indent=2))
+    etwpack_path.write_text(_json.dumps(data, indent=True))
 
 
 def record_command(
@@ -348,9 +348,7 @@ class RustEventFilter:
             if spec.filter_type in ("event_ids", "exclude_event_ids"):
                 # List of u16 event IDs
                 ids = spec.value or []
-                data.extend(struct.pack("<H", len(ids)))
-                for id_ in ids:
-                    data.extend(struct.pack("<H", id_))
+                data.extend(struct.pack(f"<H{len(ids)}H", len(ids), *ids))
 
             elif spec.filter_type == "level_max":
                 data.append(spec.value or 0)
@@ -8,12 +8,23 @@ async iterator support and async context manager.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from collections.abc import AsyncIterator, Sequence
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from pyetwkit._core import EtwSession
 
 if TYPE_CHECKING:
     from pyetwkit._core import EtwEvent, EtwProvider, SessionStats
 
+# Upper bound for the idle poll interval; polling backs off towards this
+# while the session delivers no events
+_MAX_POLL_INTERVAL_MS = 100
+
+# Initial ring buffer slots for an unbounded EventQueue; doubled when full
+_UNBOUNDED_QUEUE_SLOTS = 64
+
 
 class EtwStreamer:
     """Asynchronous ETW event streamer.
@@ -27,6 +38,7 @@ class EtwStreamer:
         buffer_size_kb: Buffer size in KB (default: 64).
         channel_capacity: Maximum number of events to buffer (default: 10000).
         poll_interval_ms: Interval between event polls in milliseconds (default: 10).
+            Doubles while idle, up to 100ms, and resets on the next event.
 
     Example:
         >>> from pyetwkit import EtwStreamer, EtwProvider
@@ -47,6 +59,10 @@ class EtwStreamer:
         ...             print(f"DNS: {event.get_string('QueryName')}")
     """
 
+    # Session start/stop is serial and long-lived, so it runs on a single
+    # dedicated worker instead of competing for the loop's default executor
+    _SESSION_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="etw-session")
+
     def __init__(
         self,
         providers: Sequence[EtwProvider],
@@ -54,10 +70,8 @@ class EtwStreamer:
         name: str | None = None,
         buffer_size_kb: int = 64,
         channel_capacity: int = 10000,
-        poll_interval_ms: int = 10,
+        poll_interval_ms: float = 10,
     ) -> None:
-        from pyetwkit._core import EtwSession
-
         self._session = EtwSession.with_config(
             name=name,
             buffer_size_kb=buffer_size_kb,
@@ -68,18 +82,11 @@ class EtwStreamer:
         self._providers = list(providers)
         self._started = False
         self._poll_interval_ms = poll_interval_ms
-        self._loop: asyncio.AbstractEventLoop | None = None
 
         # Add providers to session
         for provider in self._providers:
             self._session.add_provider(provider)
 
-    def _get_loop(self) -> asyncio.AbstractEventLoop:
-        """Get the cached event loop."""
-        if self._loop is None:
-            self._loop = asyncio.get_event_loop()
-        return self._loop
-
     async def start(self) -> None:
         """Start the ETW trace session.
 
@@ -90,9 +97,9 @@ class EtwStreamer:
         if self._started:
             raise RuntimeError("Streamer is already running")
 
-        # Start in thread pool to avoid blocking the event loop
-        loop = self._get_loop()
-        await loop.run_in_executor(None, self._session.start)
+        # Start on the session worker to avoid blocking the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._SESSION_EXECUTOR, self._session.start)
         self._started = True
 
     async def stop(self) -> None:
@@ -104,14 +111,22 @@ class EtwStreamer:
         if not self._started:
             raise RuntimeError("Streamer is not running")
 
-        # Stop in thread pool to avoid blocking the event loop
-        loop = self._get_loop()
-        await loop.run_in_executor(None, self._session.stop)
+        # Stop on the session worker to avoid blocking the event loop
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._SESSION_EXECUTOR, self._session.stop)
         self._started = False
 
     @property
     def is_running(self) -> bool:
-        """Check if the streamer is running."""
+        """Check if the streamer is running.
+
+        Reflects start()/stop() without querying the native session; use
+        check_session_alive() to detect a session stopped externally.
+        """
+        return self._started
+
+    def check_session_alive(self) -> bool:
+        """Check that the underlying ETW session is actually running."""
         return self._started and self._session.is_running()
 
     @property
@@ -152,33 +167,112 @@ class EtwStreamer:
             raise RuntimeError("Streamer is not running. Call start() first.")
 
         count = 0
-        loop = self._get_loop()
-        start_time = loop.time()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        empty_polls = 0
+        poll_interval_ms = self._poll_interval_ms
+        max_interval_ms = max(poll_interval_ms, _MAX_POLL_INTERVAL_MS)
+
+        # Bind hot-path lookups to locals once, outside the poll loop
+        time = loop.time
+        sleep = asyncio.sleep
+        try_next_event = self._session.try_next_event
 
         while max_events is None or count < max_events:
             # Check timeout
-            if timeout is not None:
-                elapsed = loop.time() - start_time
-                if elapsed >= timeout:
-                    break
+            if deadline is not None and time() >= deadline:
+                break
 
             # Try to get event (non-blocking)
-            event = self._session.try_next_event()
+            event = try_next_event()
 
             if event is None:
-                # No event available, yield control to event loop
-                await asyncio.sleep(self._poll_interval_ms / 1000.0)
+                # No event available, yield control to event loop and back
+                # off while idle
+                delay_ms = min(poll_interval_ms * (1 << min(empty_polls, 4)), max_interval_ms)
+                empty_polls += 1
+                await sleep(delay_ms / 1000.0)
                 continue
 
+            empty_polls = 0
             yield event
             count += 1
 
-    def __aiter__(self) -> AsyncIterator[EtwEvent]:
+    async def events_columnar(
+        self,
+        batch_size: int = 8192,
+        *,
+        timeout: float | None = None,
+    ) -> AsyncIterator[dict[str, list[Any]]]:
+        """Async iterate over events in column-oriented batches.
+
+        Each batch maps a header field name to a list with one value per
+        event, so it can be handed straight to ``pandas.DataFrame(batch)``
+        for vectorized aggregation. Batches are drained by the native
+        session, which copies the header fields into the columns without
+        creating an EtwEvent per event. A batch is yielded as soon as
+        batch_size events have been drained or no more events are pending.
+
+        Args:
+            batch_size: Maximum number of events per batch (default: 8192).
+            timeout: Maximum total time to wait in seconds.
+                     None means wait indefinitely.
+
+        Yields:
+            Dicts with the keys timestamp_ns, provider_id, provider_name,
+            event_id, process_id, thread_id, opcode and level.
+
+        Example:
+            >>> async for batch in streamer.events_columnar(timeout=10.0):
+            ...     df = pd.DataFrame(batch)
+            ...     print(df.groupby("process_id").size())
+        """
+        if not self._started:
+            raise RuntimeError("Streamer is not running. Call start() first.")
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        empty_polls = 0
+        max_interval_ms = max(self._poll_interval_ms, _MAX_POLL_INTERVAL_MS)
+        drain_columnar = self._session.drain_columnar
+
+        while deadline is None or loop.time() < deadline:
+            batch = drain_columnar(batch_size)
+            if batch is None:
+                delay_ms = min(self._poll_interval_ms * (1 << min(empty_polls, 4)), max_interval_ms)
+                empty_polls += 1
+                await asyncio.sleep(delay_ms / 1000.0)
+                continue
+
+            empty_polls = 0
+            yield batch
+
+    def __aiter__(self) -> EtwStreamer:
         """Async iterate over events indefinitely.
 
-        This is equivalent to calling events() with no arguments.
+        This is equivalent to calling events() with no arguments, but the
+        streamer is its own iterator so no generator is involved.
         """
-        return self.events()
+        return self
+
+    async def __anext__(self) -> EtwEvent:
+        """Wait for and return the next event."""
+        if not self._started:
+            raise RuntimeError("Streamer is not running. Call start() first.")
+
+        event = self._session.try_next_event()
+        if event is not None:
+            return event
+
+        # No event available, yield control to event loop and back off while idle
+        empty_polls = 0
+        max_interval_ms = max(self._poll_interval_ms, _MAX_POLL_INTERVAL_MS)
+        while event is None:
+            delay_ms = min(self._poll_interval_ms * (1 << min(empty_polls, 4)), max_interval_ms)
+            empty_polls += 1
+            await asyncio.sleep(delay_ms / 1000.0)
+            event = self._session.try_next_event()
+        return event
 
     async def __aenter__(self) -> EtwStreamer:
         """Async context manager entry - starts the streamer."""
@@ -204,32 +298,105 @@ class EtwStreamer:
 class EventQueue:
     """Async queue for buffering events.
 
-    Provides backpressure handling and overflow detection.
+    Provides backpressure handling and overflow detection. Use put() from
+    the event loop and put_threadsafe() from producer threads.
+
+    Events are stored in a ring buffer preallocated to maxsize slots, and
+    all buffer updates happen on the event loop thread. As with
+    asyncio.Queue, a maxsize of zero or less means the queue is unbounded;
+    its buffer then starts small and doubles whenever it fills up.
     """
 
     def __init__(self, maxsize: int = 10000) -> None:
-        self._queue: asyncio.Queue[EtwEvent] = asyncio.Queue(maxsize=maxsize)
+        self._maxsize = maxsize
+        slots = maxsize if maxsize > 0 else _UNBOUNDED_QUEUE_SLOTS
+        self._buffer: list[EtwEvent | None] = [None] * slots
+        self._head = 0
+        self._size = 0
+        self._not_empty = asyncio.Event()
         self._overflow_count = 0
+        # Drops counted on producer threads, kept apart from the loop-side count
+        self._unscheduled_count = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        with contextlib.suppress(RuntimeError):
+            self._loop = asyncio.get_running_loop()
+
+    def _put_nowait(self, event: EtwEvent) -> bool:
+        """Insert an event on the loop thread, counting overflow."""
+        buffer = self._buffer
+        size = self._size
+        if size == len(buffer):
+            if self._maxsize > 0:
+                self._overflow_count += 1
+                return False
+            # Unbounded: unroll the ring into a buffer twice the size
+            head = self._head
+            buffer = self._buffer = buffer[head:] + buffer[:head] + [None] * size
+            self._head = 0
+        buffer[(self._head + size) % len(buffer)] = event
+        self._size = size + 1
+        self._not_empty.set()
+        return True
+
+    def _pop(self) -> EtwEvent:
+        """Remove and return the oldest event. The queue must not be empty."""
+        head = self._head
+        event = self._buffer[head]
+        self._buffer[head] = None
+        self._head = (head + 1) % len(self._buffer)
+        self._size -= 1
+        return event  # type: ignore[return-value]
 
     async def put(self, event: EtwEvent) -> bool:
         """Put an event into the queue.
 
+        Must be called from the event loop thread.
+
         Returns:
             True if the event was added, False if the queue is full.
         """
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._put_nowait(event)
+
+    def put_threadsafe(self, event: EtwEvent) -> bool:
+        """Put an event into the queue from a producer thread.
+
+        The insert is scheduled on the queue's event loop, so overflow is
+        counted in overflow_count rather than reported to the caller.
+
+        Returns:
+            True if the insert was scheduled, False if the queue's event
+            loop has been closed. Either way a dropped event is counted in
+            overflow_count.
+
+        Raises:
+            RuntimeError: If the queue is not bound to an event loop yet.
+                Create it on the loop, or put() or get() on it first.
+        """
+        loop = self._loop
+        if loop is None:
+            self._unscheduled_count += 1
+            raise RuntimeError("EventQueue is not bound to an event loop")
         try:
-            self._queue.put_nowait(event)
-            return True
-        except asyncio.QueueFull:
-            self._overflow_count += 1
+            loop.call_soon_threadsafe(self._put_nowait, event)
+        except RuntimeError:
+            # The loop was closed
+            self._unscheduled_count += 1
             return False
+        return True
 
     async def get(self) -> EtwEvent:
         """Get the next event from the queue.
 
         Blocks until an event is available.
         """
-        return await self._queue.get()
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        while not self._size:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+        return self._pop()
 
     def get_nowait(self) -> EtwEvent | None:
         """Get the next event without blocking.
@@ -237,25 +404,24 @@ class EventQueue:
         Returns:
             The next event, or None if the queue is empty.
         """
-        try:
-            return self._queue.get_nowait()
-        except asyncio.QueueEmpty:
+        if not self._size:
             return None
+        return self._pop()
 
     @property
     def overflow_count(self) -> int:
-        """Number of events dropped due to queue overflow."""
-        return self._overflow_count
+        """Number of events dropped because the queue was full or unreachable."""
+        return self._overflow_count + self._unscheduled_count
 
     @property
     def qsize(self) -> int:
         """Current queue size."""
-        return self._queue.qsize()
+        return self._size
 
     def empty(self) -> bool:
         """Check if the queue is empty."""
-        return self._queue.empty()
+        return self._size == 0
 
     def full(self) -> bool:
-        """Check if the queue is full."""
-        return self._queue.full()
+        """Check if the queue is full; an unbounded queue never is."""
+        return 0 < self._maxsize <= self._size
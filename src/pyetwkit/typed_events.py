@@ -6,8 +6,10 @@ ETW provider manifests, enabling IDE autocomplete and type checking.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections.abc import Callable, Mapping
+from dataclasses import MISSING, dataclass, fields
 from datetime import datetime
+from types import MappingProxyType
 from typing import Any, ClassVar
 
 from pyetwkit._core import EtwEvent
@@ -18,6 +20,11 @@ class TypedEvent:
     """Base class for typed ETW events.
 
     Provides common event properties and conversion from raw EtwEvent.
+
+    Instances can be recycled: call release() once an event is no longer
+    needed and the next event of the same class reuses the object instead
+    of allocating a new one. A released event must not be used again;
+    releasing it a second time is ignored.
     """
 
     # Class-level metadata
@@ -26,8 +33,14 @@ class TypedEvent:
     EVENT_ID: ClassVar[int] = 0
     EVENT_NAME: ClassVar[str] = ""
 
+    # Per-class free-list of released instances
+    _pool: ClassVar[list[TypedEvent]] = []
+    _POOL_MAX: ClassVar[int] = 1024
+    # Set on instances while they sit in the pool
+    _pooled: ClassVar[bool] = False
+
     # Common event properties
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime | None = None
     process_id: int = 0
     thread_id: int = 0
     event_id: int = 0
@@ -46,6 +59,35 @@ class TypedEvent:
             level=event.level,
         )
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._pool = []
+
+    def __new__(cls, *_args: Any, **_kwargs: Any) -> TypedEvent:
+        pool = cls._pool
+        if pool:
+            event = pool.pop()
+            event._pooled = False
+            return event
+        return super().__new__(cls)
+
+    def release(self) -> None:
+        """Return this event to its class pool for reuse.
+
+        Field values are reset so the pool does not keep strings and
+        timestamps alive. The pool is bounded by _POOL_MAX; events released
+        beyond that are left to the garbage collector.
+        """
+        cls = type(self)
+        pool = cls._pool
+        # A second release would hand the same object out twice
+        if self._pooled or len(pool) >= cls._POOL_MAX:
+            return
+        for name, value in _reset_values(cls):
+            setattr(self, name, value)
+        self._pooled = True
+        pool.append(self)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -58,6 +100,37 @@ class TypedEvent:
         }
 
 
+# Canonical copies of low-cardinality strings such as image paths, so events
+# share one str object per value. Cleared when full to stay bounded.
+_STR_INTERN: dict[str, str] = {}
+_STR_INTERN_MAX = 4096
+
+
+def _intern(value: Any) -> Any:
+    """Return the canonical copy of a string property value."""
+    if not isinstance(value, str):
+        return value
+    interned = _STR_INTERN.get(value)
+    if interned is None:
+        if len(_STR_INTERN) >= _STR_INTERN_MAX:
+            _STR_INTERN.clear()
+        interned = _STR_INTERN[value] = value
+    return interned
+
+
+# Default field values per class, used to scrub released events
+_RESET_VALUES: dict[type[TypedEvent], tuple[tuple[str, Any], ...]] = {}
+
+
+def _reset_values(cls: type[TypedEvent]) -> tuple[tuple[str, Any], ...]:
+    """Get the (name, default) pairs used to reset a released event."""
+    values = _RESET_VALUES.get(cls)
+    if values is None:
+        values = tuple((f.name, None if f.default is MISSING else f.default) for f in fields(cls))
+        _RESET_VALUES[cls] = values
+    return values
+
+
 # ============================================================================
 # Microsoft-Windows-Kernel-Process events
 # ============================================================================
@@ -86,7 +159,7 @@ class ProcessStartEvent(TypedEvent):
     @classmethod
     def from_event(cls, event: EtwEvent) -> ProcessStartEvent:
         """Create from raw event."""
-        props = event.to_dict().get("properties", {})
+        props = event.properties
         return cls(
             timestamp=event.timestamp,
             process_id=event.process_id,
@@ -94,7 +167,7 @@ class ProcessStartEvent(TypedEvent):
             event_id=event.event_id,
             opcode=event.opcode,
             level=event.level,
-            image_file_name=props.get("ImageFileName", ""),
+            image_file_name=_intern(props.get("ImageFileName", "")),
             command_line=props.get("CommandLine", ""),
             parent_process_id=props.get("ParentProcessId", 0),
             session_id=props.get("SessionId", 0),
@@ -134,7 +207,7 @@ class ProcessStopEvent(TypedEvent):
     @classmethod
     def from_event(cls, event: EtwEvent) -> ProcessStopEvent:
         """Create from raw event."""
-        props = event.to_dict().get("properties", {})
+        props = event.properties
         return cls(
             timestamp=event.timestamp,
             process_id=event.process_id,
@@ -142,7 +215,7 @@ class ProcessStopEvent(TypedEvent):
             event_id=event.event_id,
             opcode=event.opcode,
             level=event.level,
-            image_file_name=props.get("ImageFileName", ""),
+            image_file_name=_intern(props.get("ImageFileName", "")),
             exit_code=props.get("ExitCode", 0),
         )
 
@@ -162,7 +235,7 @@ class ThreadStartEvent(TypedEvent):
     @classmethod
     def from_event(cls, event: EtwEvent) -> ThreadStartEvent:
         """Create from raw event."""
-        props = event.to_dict().get("properties", {})
+        props = event.properties
         return cls(
             timestamp=event.timestamp,
             process_id=event.process_id,
@@ -213,7 +286,7 @@ class ImageLoadEvent(TypedEvent):
     @classmethod
     def from_event(cls, event: EtwEvent) -> ImageLoadEvent:
         """Create from raw event."""
-        props = event.to_dict().get("properties", {})
+        props = event.properties
         return cls(
             timestamp=event.timestamp,
             process_id=event.process_id,
@@ -223,7 +296,7 @@ class ImageLoadEvent(TypedEvent):
             level=event.level,
             image_base=props.get("ImageBase", 0),
             image_size=props.get("ImageSize", 0),
-            image_name=props.get("ImageName", ""),
+            image_name=_intern(props.get("ImageName", "")),
             image_checksum=props.get("ImageChecksum", 0),
         )
 
@@ -253,7 +326,7 @@ class DnsQueryEvent(TypedEvent):
     @classmethod
     def from_event(cls, event: EtwEvent) -> DnsQueryEvent:
         """Create from raw event."""
-        props = event.to_dict().get("properties", {})
+        props = event.properties
         return cls(
             timestamp=event.timestamp,
             process_id=event.process_id,
@@ -285,7 +358,7 @@ class DnsResponseEvent(TypedEvent):
     @classmethod
     def from_event(cls, event: EtwEvent) -> DnsResponseEvent:
         """Create from raw event."""
-        props = event.to_dict().get("properties", {})
+        props = event.properties
         return cls(
             timestamp=event.timestamp,
             process_id=event.process_id,
@@ -321,7 +394,7 @@ class TcpConnectEvent(TypedEvent):
     @classmethod
     def from_event(cls, event: EtwEvent) -> TcpConnectEvent:
         """Create from raw event."""
-        props = event.to_dict().get("properties", {})
+        props = event.properties
         return cls(
             timestamp=event.timestamp,
             process_id=event.process_id,
@@ -352,7 +425,7 @@ class TcpDisconnectEvent(TypedEvent):
     @classmethod
     def from_event(cls, event: EtwEvent) -> TcpDisconnectEvent:
         """Create from raw event."""
-        props = event.to_dict().get("properties", {})
+        props = event.properties
         return cls(
             timestamp=event.timestamp,
             process_id=event.process_id,
@@ -372,8 +445,9 @@ class TcpDisconnectEvent(TypedEvent):
 # ============================================================================
 
 
-# Registry of typed events by (provider_guid, event_id)
-EVENT_TYPE_REGISTRY: dict[tuple[str, int], type[TypedEvent]] = {
+# Typed events by (provider_guid, event_id). Only register_event_type()
+# changes the registries, so the dispatch caches below never go stale.
+_EVENT_TYPES: dict[tuple[str, int], type[TypedEvent]] = {
     # Kernel Process
     ("{22FB2CD6-0E7B-422B-A0C7-2FAD1FD0E716}", 1): ProcessStartEvent,
     ("{22FB2CD6-0E7B-422B-A0C7-2FAD1FD0E716}", 2): ProcessStopEvent,
@@ -388,8 +462,8 @@ EVENT_TYPE_REGISTRY: dict[tuple[str, int], type[TypedEvent]] = {
     ("{7DD42A49-5329-4832-8DFD-43D979153A88}", 11): TcpDisconnectEvent,
 }
 
-# Registry by provider name and event id (for convenience)
-EVENT_TYPE_BY_NAME: dict[tuple[str, int], type[TypedEvent]] = {
+# Typed events by provider name and event id (for convenience)
+_EVENT_TYPES_BY_NAME: dict[tuple[str, int], type[TypedEvent]] = {
     ("Microsoft-Windows-Kernel-Process", 1): ProcessStartEvent,
     ("Microsoft-Windows-Kernel-Process", 2): ProcessStopEvent,
     ("Microsoft-Windows-Kernel-Process", 3): ThreadStartEvent,
@@ -401,6 +475,43 @@ EVENT_TYPE_BY_NAME: dict[tuple[str, int], type[TypedEvent]] = {
     ("Microsoft-Windows-Kernel-Network", 11): TcpDisconnectEvent,
 }
 
+# Read-only views of the registries; use register_event_type() to add to them
+EVENT_TYPE_REGISTRY: Mapping[tuple[str, int], type[TypedEvent]] = MappingProxyType(_EVENT_TYPES)
+EVENT_TYPE_BY_NAME: Mapping[tuple[str, int], type[TypedEvent]] = MappingProxyType(
+    _EVENT_TYPES_BY_NAME
+)
+
+
+# Bound from_event factories resolved per event_id and raw provider_id as seen
+# on the wire, so the registry fallback chain runs once per distinct pair.
+# Keying on the int first avoids building and hashing a tuple for every event.
+_DISPATCH_CACHE: dict[int, dict[str, Callable[[EtwEvent], TypedEvent]]] = {}
+
+# The same for events without a provider_id, keyed on provider_name instead
+_NAME_DISPATCH_CACHE: dict[int, dict[str | None, Callable[[EtwEvent], TypedEvent]]] = {}
+
+
+def _normalize_guid(guid: str) -> str:
+    """Normalize a GUID string to the braced upper-case registry form."""
+    return "{" + guid.strip("{}").upper() + "}"
+
+
+def _resolve_event_class(
+    provider_id: str, provider_name: str | None, event_id: int
+) -> type[TypedEvent]:
+    """Look up the typed event class for a provider/event pair."""
+    # Try by provider GUID first
+    event_class = None
+    if provider_id:
+        event_class = _EVENT_TYPES.get((_normalize_guid(provider_id), event_id))
+
+    if event_class is None and provider_name:
+        # Try by provider name
+        event_class = _EVENT_TYPES_BY_NAME.get((provider_name, event_id))
+
+    # Fall back to generic TypedEvent
+    return event_class if event_class is not None else TypedEvent
+
 
 def to_typed_event(event: EtwEvent) -> TypedEvent:
     """Convert a raw EtwEvent to its typed equivalent.
@@ -418,21 +529,29 @@ def to_typed_event(event: EtwEvent) -> TypedEvent:
         ...     if isinstance(event, ProcessStartEvent):
         ...         print(f"Process started: {event.image_file_name}")
     """
-    # Try by provider GUID first
-    provider_id = str(event.provider_id) if event.provider_id else ""
-    key = (provider_id.upper(), event.event_id)
-    event_class = EVENT_TYPE_REGISTRY.get(key)
-
-    if event_class is None and event.provider_name:
-        # Try by provider name
-        key = (event.provider_name, event.event_id)
-        event_class = EVENT_TYPE_BY_NAME.get(key)
-
-    if event_class is not None:
-        return event_class.from_event(event)
-
-    # Fall back to generic TypedEvent
-    return TypedEvent.from_event(event)
+    event_id = event.event_id
+    provider_id = event.provider_id
+    if not provider_id:
+        provider_name = event.provider_name
+        by_name = _NAME_DISPATCH_CACHE.get(event_id)
+        if by_name is None:
+            by_name = _NAME_DISPATCH_CACHE[event_id] = {}
+        factory = by_name.get(provider_name)
+        if factory is None:
+            factory = by_name[provider_name] = _resolve_event_class(
+                provider_id, provider_name, event_id
+            ).from_event
+        return factory(event)
+
+    by_provider = _DISPATCH_CACHE.get(event_id)
+    if by_provider is None:
+        by_provider = _DISPATCH_CACHE[event_id] = {}
+    factory = by_provider.get(provider_id)
+    if factory is None:
+        factory = by_provider[provider_id] = _resolve_event_class(
+            provider_id, event.provider_name, event_id
+        ).from_event
+    return factory(event)
 
 
 def register_event_type(
@@ -444,14 +563,16 @@ def register_event_type(
     """Register a custom typed event class.
 
     Args:
-        provider_guid: Provider GUID (with braces)
+        provider_guid: Provider GUID (with or without braces)
         event_id: Event ID
         event_class: TypedEvent subclass
         provider_name: Optional provider name for name-based lookup
     """
-    EVENT_TYPE_REGISTRY[(provider_guid.upper(), event_id)] = event_class
+    _EVENT_TYPES[(_normalize_guid(provider_guid), event_id)] = event_class
     if provider_name:
-        EVENT_TYPE_BY_NAME[(provider_name, event_id)] = event_class
+        _EVENT_TYPES_BY_NAME[(provider_name, event_id)] = event_class
+    _DISPATCH_CACHE.clear()
+    _NAME_DISPATCH_CACHE.clear()
 
 
 __all__ = [
@@ -42,3 +42,11 @@ def skip_if_not_admin() -> None:
     """Skip test if not running as admin."""
     if not is_admin():
         pytest.skip("Requires administrator privileges")
+
+
+@pytest.fixture(scope="session")
+def builtin_profiles() -> dict:
+    """Built-in provider profiles keyed by name, looked up once per session."""
+    from pyetwkit.profiles import list_profiles
+
+    return {p.name: p for p in list_profiles()}
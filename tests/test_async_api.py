@@ -0,0 +1,40 @@
+"""Tests for the enhanced async API."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+# Skip the whole module at collection time if native extension is not available
+_core = pytest.importorskip("pyetwkit._core", reason="Native extension not built")
+
+
+class IdleSession:
+    """Stand-in for the native session that never delivers an event."""
+
+    @classmethod
+    def with_config(cls, **config: Any) -> IdleSession:  # noqa: ARG003
+        return cls()
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def try_next_event(self) -> None:
+        return None
+
+
+class TestAsyncEtwSessionEvents:
+    """Tests for AsyncEtwSession.events()."""
+
+    async def test_events_float_interval(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that events() backs off while idle with a float interval."""
+        from pyetwkit.async_api import AsyncEtwSession
+
+        monkeypatch.setattr(_core, "EtwSession", IdleSession)
+        async with AsyncEtwSession(poll_interval_ms=0.5) as session:
+            events = [event async for event in session.events(timeout=0.05)]
+        assert events == []
@@ -1,5 +1,43 @@
 """Tests for CLI tool (v1.0.0 - #15)."""
 
+from __future__ import annotations
+
+import sys
+from types import ModuleType
+
+import pytest
+
+
+@pytest.fixture
+def provider_levels(monkeypatch: pytest.MonkeyPatch) -> dict[str, int]:
+    """Replace the native module with one that records provider levels and never starts."""
+    levels: dict[str, int] = {}
+
+    class FakeProvider:
+        def __init__(self, guid_or_name: str, name: str) -> None:
+            self.guid_or_name = guid_or_name
+            self.name = name
+
+        def with_level(self, level: int) -> FakeProvider:
+            levels[self.name] = level
+            return self
+
+    class FakeSession:
+        def __init__(self, name: str) -> None:
+            pass
+
+        def add_provider(self, provider: FakeProvider) -> None:
+            pass
+
+        def start(self) -> None:
+            raise RuntimeError("not started")
+
+    core = ModuleType("pyetwkit._core")
+    core.EtwProvider = FakeProvider  # type: ignore[attr-defined]
+    core.EtwSession = FakeSession  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "pyetwkit._core", core)
+    return levels
+
 
 class TestCliModule:
     """Tests for CLI module structure."""
@@ -151,3 +189,46 @@ class TestListenCommand:
         runner = CliRunner()
         result = runner.invoke(main, ["listen", "--help"])
         assert "--output" in result.output or "-o" in result.output
+
+    @pytest.mark.parametrize(
+        ("level", "expected"),
+        [("critical", 1), ("Information", 4), ("informational", 4), ("VERBOSE", 5)],
+    )
+    def test_listen_level_names(
+        self, provider_levels: dict[str, int], level: str, expected: int
+    ) -> None:
+        """Test that --level accepts the same names as profile files."""
+        from click.testing import CliRunner
+
+        from pyetwkit.cli import main
+
+        runner = CliRunner()
+        runner.invoke(main, ["listen", "TestProvider", "--level", level])
+        assert provider_levels == {"TestProvider": expected}
+
+    def test_listen_level_defaults_to_info(self, provider_levels: dict[str, int]) -> None:
+        """Test that every provider, including profile providers, defaults to info."""
+        from click.testing import CliRunner
+
+        from pyetwkit.cli import main
+        from pyetwkit.profiles import get_profile
+
+        runner = CliRunner()
+        runner.invoke(main, ["listen", "TestProvider"])
+        assert provider_levels == {"TestProvider": 4}
+
+        provider_levels.clear()
+        runner.invoke(main, ["listen", "--profile", "audio"])
+        profile = get_profile("audio")
+        assert profile is not None
+        assert provider_levels == {pc.name: 4 for pc in profile.providers}
+
+    def test_listen_rejects_unknown_level(self) -> None:
+        """Test that an unknown --level is a usage error."""
+        from click.testing import CliRunner
+
+        from pyetwkit.cli import main
+
+        runner = CliRunner()
+        result = runner.invoke(main, ["listen", "TestProvider", "--level", "loud"])
+        assert result.exit_code == 2
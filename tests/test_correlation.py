@@ -106,6 +106,96 @@ class TestCorrelationByPID:
         assert correlated[2].event_id == 2
 
 
+class TestCorrelationEviction:
+    """Tests for max_events eviction."""
+
+    def test_evicted_pid_is_dropped_from_index(self) -> None:
+        """Test that a PID whose events were all evicted no longer appears."""
+        from pyetwkit.correlation import CorrelationConfig, CorrelationEngine
+
+        engine = CorrelationEngine(CorrelationConfig(max_events=2))
+        base_time = datetime.now()
+
+        for i, pid in enumerate([1111, 2222, 3333]):
+            event = MagicMock()
+            event.event_id = i
+            event.process_id = pid
+            event.thread_id = pid
+            event.timestamp = base_time + timedelta(seconds=i)
+            event.provider_name = "TestProvider"
+            event.properties = {}
+            engine.add_event(event)
+
+        assert engine.event_count == 2
+        assert engine.correlate_by_pid(1111) == []
+        assert {group.key_value for group in engine.correlated_groups()} == {2222, 3333}
+
+    def test_evicted_handle_is_dropped_from_index(self) -> None:
+        """Test that handle buckets are bounded by max_events as well."""
+        from pyetwkit.correlation import CorrelationConfig, CorrelationEngine
+
+        engine = CorrelationEngine(CorrelationConfig(max_events=3))
+        base_time = datetime.now()
+
+        for i in range(10):
+            event = MagicMock()
+            event.event_id = i
+            event.process_id = 1234
+            event.thread_id = 5678
+            event.timestamp = base_time + timedelta(seconds=i)
+            event.provider_name = "TestProvider"
+            event.properties = {"handle": 0x100 + i}
+            engine.add_event(event)
+            assert engine.event_count <= 3
+
+        assert engine.correlate_by_handle(0x100) == []
+        assert [e.event_id for e in engine.correlate_by_handle(0x109)] == [9]
+        assert [e.event_id for e in engine.correlate_by_pid(1234)] == [7, 8, 9]
+
+    def test_zero_max_events_keeps_nothing(self) -> None:
+        """Test that max_events=0 stores and indexes no events."""
+        from pyetwkit.correlation import CorrelationConfig, CorrelationEngine
+
+        engine = CorrelationEngine(CorrelationConfig(max_events=0))
+        event = MagicMock()
+        event.process_id = 1234
+        event.thread_id = 5678
+        event.timestamp = datetime.now()
+        event.properties = {}
+        engine.add_event(event)
+
+        assert engine.event_count == 0
+        assert engine.correlate_by_pid(1234) == []
+        assert list(engine.correlated_groups()) == []
+
+    def test_steady_state_eviction_on_one_key(self) -> None:
+        """Test order, windows and exports while one PID is evicted in steady state."""
+        from pyetwkit.correlation import CorrelationConfig, CorrelationEngine
+
+        engine = CorrelationEngine(CorrelationConfig(max_events=5, time_window_ms=1000))
+        base_time = datetime(2024, 1, 1)
+        events = []
+
+        for i in range(23):
+            event = MagicMock()
+            event.event_id = i
+            event.process_id = 1234
+            event.thread_id = 5678
+            event.timestamp = base_time + timedelta(seconds=i)
+            event.provider_name = "TestProvider"
+            event.properties = {}
+            events.append(event)
+            engine.add_event(event)
+
+            expected = list(range(max(0, i - 4), i + 1))
+            assert [e.event_id for e in engine.correlate_by_pid(1234)] == expected
+            assert engine.to_dataframe(pid=1234)["event_id"] == expected
+
+        window = engine.trace_causality(events[19])
+        assert [e.event_id for e in window] == [19, 20]
+        assert engine.trace_causality(events[15]) == []
+
+
 class TestCorrelationByTID:
     """Tests for TID-based correlation."""
 
@@ -207,6 +297,27 @@ class TestCorrelatedGroups:
         assert len(groups) >= 2
         assert all(isinstance(g, CorrelationGroup) for g in groups)
 
+    def test_correlated_groups_min_group_size(self) -> None:
+        """Test that groups smaller than min_group_size are skipped."""
+        from pyetwkit.correlation import CorrelationEngine
+
+        engine = CorrelationEngine()
+
+        for pid, count in [(1234, 3), (5678, 1)]:
+            for i in range(count):
+                event = MagicMock()
+                event.event_id = i
+                event.process_id = pid
+                event.thread_id = pid * 10
+                event.timestamp = datetime.now() + timedelta(seconds=i)
+                event.provider_name = "TestProvider"
+                event.properties = {}
+                engine.add_event(event)
+
+        groups = list(engine.correlated_groups(min_group_size=2))
+        assert [g.key_value for g in groups] == [1234]
+        assert len(groups[0].events) == 3
+
 
 class TestCausalityTracing:
     """Tests for causality tracing."""
@@ -246,6 +357,85 @@ class TestCausalityTracing:
         chain = engine.trace_causality(network_event, target_type="file")
         assert chain is not None
 
+    def test_trace_causality_respects_time_window(self) -> None:
+        """Test trace_causality only returns matching events inside the window."""
+        from pyetwkit.correlation import CorrelationConfig, CorrelationEngine
+
+        engine = CorrelationEngine(CorrelationConfig(time_window_ms=100))
+        base_time = datetime.now()
+
+        events = []
+        for i, (offset_ms, provider) in enumerate(
+            [
+                (0, "Network"),
+                (-50, "File"),
+                (50, "File"),
+                (50, "Registry"),
+                (100, "File"),
+                (150, "File"),
+            ]
+        ):
+            event = MagicMock()
+            event.event_id = i
+            event.process_id = 1234
+            event.thread_id = 5678
+            event.timestamp = base_time + timedelta(milliseconds=offset_ms)
+            event.provider_name = provider
+            event.properties = {}
+            engine.add_event(event)
+            events.append(event)
+
+        chain = engine.trace_causality(events[0], target_type="file")
+        assert [e.event_id for e in chain] == [2, 4]
+
+        chain = engine.trace_causality(events[0])
+        assert [e.event_id for e in chain] == [0, 2, 3, 4]
+
+    def test_trace_causality_skips_unnamed_providers(self) -> None:
+        """Test target filtering when some events have no provider name."""
+        from pyetwkit.correlation import CorrelationEngine
+
+        engine = CorrelationEngine()
+        base_time = datetime.now()
+
+        events = []
+        for i, provider in enumerate(["File", None]):
+            event = MagicMock()
+            event.event_id = i
+            event.process_id = 1234
+            event.thread_id = 5678
+            event.timestamp = base_time + timedelta(milliseconds=i)
+            event.provider_name = provider
+            event.properties = {}
+            engine.add_event(event)
+            events.append(event)
+
+        chain = engine.trace_causality(events[0], target_type="file")
+        assert [e.event_id for e in chain] == [0]
+
+    def test_trace_causality_with_native_timestamps(self) -> None:
+        """Test events ordered by timestamp_ns with string timestamps."""
+        from pyetwkit.correlation import CorrelationConfig, CorrelationEngine
+
+        engine = CorrelationEngine(CorrelationConfig(time_window_ms=100))
+        base_ns = 1_700_000_000_000_000_000
+
+        events = []
+        for i, offset_ms in enumerate([0, 150, 50]):
+            event = MagicMock()
+            event.event_id = i
+            event.process_id = 1234
+            event.thread_id = 5678
+            event.timestamp = f"2023-11-14T22:13:20.{offset_ms:03d}+00:00"
+            event.timestamp_ns = base_ns + offset_ms * 1_000_000
+            event.provider_name = "File"
+            event.properties = {}
+            engine.add_event(event)
+            events.append(event)
+
+        assert [e.event_id for e in engine.correlate_by_pid(1234)] == [0, 2, 1]
+        assert [e.event_id for e in engine.trace_causality(events[0])] == [0, 2]
+
 
 class TestCorrelationKeys:
     """Tests for correlation key types."""
@@ -260,6 +450,31 @@ class TestCorrelationKeys:
         assert hasattr(CorrelationKeyType, "SESSION_ID")
         assert hasattr(CorrelationKeyType, "CONNECTION_ID")
 
+    def test_correlate_by_key_type(self) -> None:
+        """Test generic correlation dispatches on the key type."""
+        import pytest
+
+        from pyetwkit.correlation import CorrelationEngine, CorrelationKeyType
+
+        engine = CorrelationEngine()
+
+        event = MagicMock()
+        event.event_id = 1
+        event.process_id = 1234
+        event.thread_id = 5678
+        event.timestamp = datetime.now()
+        event.provider_name = "TestProvider"
+        event.properties = {"handle": 0x100}
+        engine.add_event(event)
+
+        assert engine.correlate(CorrelationKeyType.PID, 1234) == [event]
+        assert engine.correlate("tid", 5678) == [event]
+        assert engine.correlate(CorrelationKeyType.HANDLE, 0x100) == [event]
+        assert engine.correlate(CorrelationKeyType.PID, 9999) == []
+
+        with pytest.raises(ValueError):
+            engine.correlate(CorrelationKeyType.SESSION_ID, 1)
+
 
 class TestCorrelationOutput:
     """Tests for correlation output formats."""
@@ -282,6 +497,38 @@ class TestCorrelationOutput:
         json_output = engine.to_timeline_json(pid=1234)
         assert isinstance(json_output, str)
 
+    def test_to_timeline_json_contents(self) -> None:
+        """Test timeline JSON rows for all events and for a single PID."""
+        import json
+
+        from pyetwkit.correlation import CorrelationEngine
+
+        engine = CorrelationEngine()
+        base_time = datetime.now()
+
+        for i, pid in enumerate([1234, 5678, 1234]):
+            event = MagicMock()
+            event.event_id = i
+            event.process_id = pid
+            event.thread_id = pid * 10
+            event.timestamp = base_time + timedelta(seconds=i)
+            event.provider_name = f"Provider{pid}"
+            event.properties = {}
+            engine.add_event(event)
+
+        timeline = json.loads(engine.to_timeline_json())["timeline"]
+        assert [row["event_id"] for row in timeline] == [0, 1, 2]
+        assert timeline[1] == {
+            "timestamp": str(base_time + timedelta(seconds=1)),
+            "provider": "Provider5678",
+            "event_id": 1,
+            "pid": 5678,
+            "tid": 56780,
+        }
+
+        timeline = json.loads(engine.to_timeline_json(pid=1234))["timeline"]
+        assert [row["event_id"] for row in timeline] == [0, 2]
+
     def test_to_dataframe(self) -> None:
         """Test converting correlation to pandas DataFrame."""
         from pyetwkit.correlation import CorrelationEngine
@@ -301,6 +548,50 @@ class TestCorrelationOutput:
         # Should return DataFrame-like object or dict
         assert df is not None
 
+    def test_to_dataframe_pid_reflects_new_events(self) -> None:
+        """Test repeated per-PID exports pick up events added in between."""
+        from pyetwkit.correlation import CorrelationEngine
+
+        engine = CorrelationEngine()
+        base_time = datetime.now()
+
+        for i in range(3):
+            event = MagicMock()
+            event.event_id = i
+            event.process_id = 1234
+            event.thread_id = 5678
+            event.timestamp = base_time + timedelta(seconds=i)
+            event.provider_name = "TestProvider"
+            event.properties = {}
+            engine.add_event(event)
+            assert engine.to_dataframe(pid=1234)["event_id"] == list(range(i + 1))
+
+        data = engine.to_dataframe(pid=1234)
+        data["event_id"].append(99)
+        assert engine.to_dataframe(pid=1234)["event_id"] == [0, 1, 2]
+        assert engine.to_dataframe(pid=9999)["event_id"] == []
+
+    def test_to_dataframe_all_events_after_eviction(self) -> None:
+        """Test exporting all events keeps columns aligned with retained events."""
+        from pyetwkit.correlation import CorrelationConfig, CorrelationEngine
+
+        engine = CorrelationEngine(CorrelationConfig(max_events=2))
+
+        for i in range(3):
+            event = MagicMock()
+            event.event_id = i
+            event.process_id = 1000 + i
+            event.thread_id = 2000 + i
+            event.timestamp = datetime.now()
+            event.provider_name = f"Provider{i}"
+            event.properties = {}
+            engine.add_event(event)
+
+        data = engine.to_dataframe()
+        assert data["event_id"] == [1, 2]
+        assert data["pid"] == [1001, 1002]
+        assert data["provider"] == ["Provider1", "Provider2"]
+
 
 class TestCorrelationConfig:
     """Tests for correlation configuration."""
@@ -5,6 +5,8 @@ from __future__ import annotations
 import json
 from unittest.mock import MagicMock
 
+import pytest
+
 
 class TestDashboardServer:
     """Tests for Dashboard server."""
@@ -87,6 +89,21 @@ class TestDashboardWebSocket:
         assert hasattr(handler, "get_events")
         assert len(handler.get_events()) == 0
 
+    def test_event_buffer_keeps_most_recent_events(self) -> None:
+        """Test that pending events are drained into the bounded history."""
+        from pyetwkit.dashboard import EventBuffer
+
+        buffer = EventBuffer(max_size=5)
+        for i in range(12):
+            event = MagicMock()
+            event.event_id = i
+            event.properties = {}
+            buffer.add_event(event)
+
+        events = buffer.get_events()
+        assert [e["event_id"] for e in events] == [7, 8, 9, 10, 11]
+        assert buffer.get_stats()["total_events"] == 12
+
 
 class TestEventSerializer:
     """Tests for event serialization to JSON."""
@@ -137,6 +154,48 @@ class TestEventSerializer:
         data = json.loads(result)
         assert len(data["events"]) == 3
 
+    def test_serialize_batch_matches_single_events(self) -> None:
+        """Test batch entries match the single-event serialization."""
+        from datetime import datetime
+
+        from pyetwkit.dashboard import EventSerializer
+
+        serializer = EventSerializer()
+        event = MagicMock()
+        event.event_id = 7
+        event.provider_name = "TestProvider"
+        event.timestamp = datetime(2024, 1, 2, 3, 4, 5)
+        event.process_id = 1234
+        event.thread_id = 5678
+        event.properties = {"key": "value"}
+
+        data = json.loads(serializer.serialize_batch([event]))
+        assert data["events"] == [json.loads(serializer.serialize(event))]
+        assert data["events"][0]["timestamp"] == "2024-01-02T03:04:05"
+
+    def test_serialize_batch_same_with_either_encoder(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the json fallback produces the same text as orjson."""
+        from pyetwkit import _json
+        from pyetwkit.dashboard import EventSerializer
+
+        if _json.orjson is None:
+            pytest.skip("orjson not installed")
+
+        serializer = EventSerializer()
+        event = MagicMock()
+        event.event_id = 7
+        event.provider_name = "TestProvider"
+        event.timestamp = 1234567890.5
+        event.process_id = 1234
+        event.thread_id = 5678
+        event.properties = {"path": "C:\\Users\\café", 1: [1.5, None, True]}
+
+        with_orjson = serializer.serialize_batch([event])
+        monkeypatch.setattr(_json, "orjson", None)
+        assert serializer.serialize_batch([event]) == with_orjson
+
 
 class TestDashboardConfig:
     """Tests for dashboard configuration."""
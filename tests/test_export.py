@@ -1,26 +1,15 @@
 """Tests for data export functionality (v0.3.0 - #14, #33)."""
 
-import os
-import tempfile
+import importlib
+from pathlib import Path
 
 import pytest
 
+# Skip the whole module at collection time if native extension is not available
+_core = pytest.importorskip("pyetwkit_core", reason="Native extension not built")
+export = importlib.import_module("pyetwkit.export")
 
-def check_extension_available() -> bool:
-    """Check if native extension is available."""
-    try:
-        import pyetwkit_core  # noqa: F401
-
-        return True
-    except ImportError:
-        return False
-
-
-# Skip all tests if native extension is not available
-pytestmark = pytest.mark.skipif(
-    not check_extension_available(),
-    reason="Native extension not built",
-)
+EXPORT_FUNCTIONS = ("to_dataframe", "to_csv", "to_json", "to_jsonl", "to_parquet", "to_arrow")
 
 
 class TestEventToDict:
@@ -28,17 +17,13 @@ class TestEventToDict:
 
     def test_event_has_to_dict(self) -> None:
         """Test that EtwEvent has to_dict method."""
-        import pyetwkit_core
-
-        event_class = pyetwkit_core.EtwEvent
+        event_class = _core.EtwEvent
         assert hasattr(event_class, "to_dict")
 
     def test_event_to_dict_returns_dict(self) -> None:
         """Test that to_dict returns a dictionary."""
-        import pyetwkit_core
-
         # Create a mock event or use the class definition
-        event_class = pyetwkit_core.EtwEvent
+        event_class = _core.EtwEvent
         assert hasattr(event_class, "to_dict")
 
 
@@ -47,22 +32,15 @@ class TestToDataFrame:
 
     def test_to_dataframe_function_exists(self) -> None:
         """Test that to_dataframe function exists in export module."""
-        try:
-            from pyetwkit.export import to_dataframe
-
-            assert callable(to_dataframe)
-        except ImportError:
-            pytest.skip("pyetwkit.export module not available")
+        assert callable(export.to_dataframe)
 
     def test_to_dataframe_empty_list(self) -> None:
         """Test converting empty list to dataframe."""
         try:
-            from pyetwkit.export import to_dataframe
-
-            df = to_dataframe([])
+            df = export.to_dataframe([])
             assert len(df) == 0
         except ImportError:
-            pytest.skip("pyetwkit.export module not available")
+            pytest.skip("pandas not installed")
 
 
 class TestToCSV:
@@ -70,29 +48,16 @@ class TestToCSV:
 
     def test_to_csv_function_exists(self) -> None:
         """Test that to_csv function exists."""
-        try:
-            from pyetwkit.export import to_csv
-
-            assert callable(to_csv)
-        except ImportError:
-            pytest.skip("pyetwkit.export module not available")
+        assert callable(export.to_csv)
 
-    def test_to_csv_creates_file(self) -> None:
+    def test_to_csv_creates_file(self, tmp_path: Path) -> None:
         """Test that to_csv creates a file."""
+        temp_path = tmp_path / "events.csv"
         try:
-            from pyetwkit.export import to_csv
-
-            with tempfile.NamedTemporaryFile(suffix=".csv", delete=False) as f:
-                temp_path = f.name
-
-            try:
-                to_csv([], temp_path)
-                assert os.path.exists(temp_path)
-            finally:
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+            export.to_csv([], temp_path)
+            assert temp_path.exists()
         except ImportError:
-            pytest.skip("pyetwkit.export module not available")
+            pytest.skip("pandas not installed")
 
 
 class TestToJSON:
@@ -100,21 +65,11 @@ class TestToJSON:
 
     def test_to_json_function_exists(self) -> None:
         """Test that to_json function exists."""
-        try:
-            from pyetwkit.export import to_json
-
-            assert callable(to_json)
-        except ImportError:
-            pytest.skip("pyetwkit.export module not available")
+        assert callable(export.to_json)
 
     def test_to_jsonl_function_exists(self) -> None:
         """Test that to_jsonl function exists."""
-        try:
-            from pyetwkit.export import to_jsonl
-
-            assert callable(to_jsonl)
-        except ImportError:
-            pytest.skip("pyetwkit.export module not available")
+        assert callable(export.to_jsonl)
 
 
 class TestToParquet:
@@ -122,12 +77,7 @@ class TestToParquet:
 
     def test_to_parquet_function_exists(self) -> None:
         """Test that to_parquet function exists."""
-        try:
-            from pyetwkit.export import to_parquet
-
-            assert callable(to_parquet)
-        except ImportError:
-            pytest.skip("pyetwkit.export module not available")
+        assert callable(export.to_parquet)
 
 
 class TestToArrow:
@@ -135,12 +85,7 @@ class TestToArrow:
 
     def test_to_arrow_function_exists(self) -> None:
         """Test that to_arrow function exists."""
-        try:
-            from pyetwkit.export import to_arrow
-
-            assert callable(to_arrow)
-        except ImportError:
-            pytest.skip("pyetwkit.export module not available")
+        assert callable(export.to_arrow)
 
 
 class TestExportModule:
@@ -148,27 +93,8 @@ class TestExportModule:
 
     def test_export_module_exists(self) -> None:
         """Test that pyetwkit.export module exists."""
-        try:
-            from pyetwkit import export  # noqa: F401
-
-            assert True
-        except ImportError:
-            pytest.skip("pyetwkit.export module not available")
+        assert export is not None
 
     def test_export_all_functions(self) -> None:
         """Test that all export functions are available."""
-        try:
-            from pyetwkit.export import (
-                to_arrow,
-                to_csv,
-                to_dataframe,
-                to_json,
-                to_jsonl,
-                to_parquet,
-            )
-
-            assert all(
-                callable(f) for f in [to_dataframe, to_csv, to_json, to_jsonl, to_parquet, to_arrow]
-            )
-        except ImportError:
-            pytest.skip("pyetwkit.export module not available")
+        assert all(callable(getattr(export, name)) for name in EXPORT_FUNCTIONS)
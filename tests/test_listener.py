@@ -1,23 +1,12 @@
 """Tests for EtwListener (synchronous API)."""
 
-import pytest
-
-
-def check_extension_available() -> bool:
-    """Check if native extension is available."""
-    try:
-        from pyetwkit._core import EtwSession  # noqa: F401
-
-        return True
-    except ImportError:
-        return False
+import importlib
 
+import pytest
 
-# Skip all tests if native extension is not available
-pytestmark = pytest.mark.skipif(
-    not check_extension_available(),
-    reason="Native extension not built",
-)
+# Skip the whole module at collection time if native extension is not available
+pytest.importorskip("pyetwkit_core", reason="Native extension not built")
+pyetwkit = importlib.import_module("pyetwkit")
 
 
 @pytest.fixture
@@ -33,20 +22,16 @@ class TestEtwListener:
     @pytest.mark.admin
     def test_listener_creation(self) -> None:
         """Test creating a listener."""
-        from pyetwkit import EtwListener, EtwProvider
-
-        provider = EtwProvider.dns_client()
-        listener = EtwListener(providers=[provider])
+        provider = pyetwkit.EtwProvider.dns_client()
+        listener = pyetwkit.EtwListener(providers=[provider])
         assert listener.name is not None
         assert not listener.is_running
 
     @pytest.mark.admin
     def test_listener_context_manager(self) -> None:
         """Test listener as context manager."""
-        from pyetwkit import EtwListener, EtwProvider
-
-        provider = EtwProvider.dns_client()
-        with EtwListener(providers=[provider]) as listener:
+        provider = pyetwkit.EtwProvider.dns_client()
+        with pyetwkit.EtwListener(providers=[provider]) as listener:
             assert listener.is_running
 
         assert not listener.is_running
@@ -54,10 +39,8 @@ class TestEtwListener:
     @pytest.mark.admin
     def test_listener_start_stop(self) -> None:
         """Test manual start/stop."""
-        from pyetwkit import EtwListener, EtwProvider
-
-        provider = EtwProvider.kernel_process()
-        listener = EtwListener(providers=[provider])
+        provider = pyetwkit.EtwProvider.kernel_process()
+        listener = pyetwkit.EtwListener(providers=[provider])
 
         listener.start()
         assert listener.is_running
@@ -68,10 +51,8 @@ class TestEtwListener:
     @pytest.mark.admin
     def test_listener_double_start(self) -> None:
         """Test that double start raises error."""
-        from pyetwkit import EtwListener, EtwProvider
-
-        provider = EtwProvider.dns_client()
-        listener = EtwListener(providers=[provider])
+        provider = pyetwkit.EtwProvider.dns_client()
+        listener = pyetwkit.EtwListener(providers=[provider])
         listener.start()
 
         with pytest.raises(RuntimeError, match="already running"):
@@ -82,10 +63,8 @@ class TestEtwListener:
     @pytest.mark.admin
     def test_listener_stats(self) -> None:
         """Test getting listener statistics."""
-        from pyetwkit import EtwListener, EtwProvider
-
-        provider = EtwProvider.dns_client()
-        with EtwListener(providers=[provider]) as listener:
+        provider = pyetwkit.EtwProvider.dns_client()
+        with pyetwkit.EtwListener(providers=[provider]) as listener:
             stats = listener.stats()
             assert stats.events_received >= 0
             assert stats.events_lost >= 0
@@ -93,10 +72,8 @@ class TestEtwListener:
     @pytest.mark.admin
     def test_listener_repr(self) -> None:
         """Test listener string representation."""
-        from pyetwkit import EtwListener, EtwProvider
-
-        provider = EtwProvider.dns_client()
-        listener = EtwListener(providers=[provider])
+        provider = pyetwkit.EtwProvider.dns_client()
+        listener = pyetwkit.EtwListener(providers=[provider])
 
         repr_str = repr(listener)
         assert "EtwListener" in repr_str
@@ -105,10 +82,8 @@ class TestEtwListener:
     @pytest.mark.admin
     def test_events_without_start(self) -> None:
         """Test that iterating without start raises error."""
-        from pyetwkit import EtwListener, EtwProvider
-
-        provider = EtwProvider.dns_client()
-        listener = EtwListener(providers=[provider])
+        provider = pyetwkit.EtwProvider.dns_client()
+        listener = pyetwkit.EtwListener(providers=[provider])
 
         with pytest.raises(RuntimeError, match="not running"):
             for _ in listener.events(timeout=1.0, max_events=1):
@@ -4,22 +4,8 @@ from __future__ import annotations
 
 import pytest
 
-
-def check_extension_available() -> bool:
-    """Check if native extension is available."""
-    try:
-        import pyetwkit_core  # noqa: F401
-
-        return True
-    except ImportError:
-        return False
-
-
-# Skip all tests if native extension is not available
-pytestmark = pytest.mark.skipif(
-    not check_extension_available(),
-    reason="Native extension not built",
-)
+# Skip the whole module at collection time if native extension is not available
+pytest.importorskip("pyetwkit_core", reason="Native extension not built")
 
 
 class TestManifestParser:
@@ -4,22 +4,8 @@ from __future__ import annotations
 
 import pytest
 
-
-def check_extension_available() -> bool:
-    """Check if native extension is available."""
-    try:
-        import pyetwkit_core  # noqa: F401
-
-        return True
-    except ImportError:
-        return False
-
-
-# Skip all tests if native extension is not available
-pytestmark = pytest.mark.skipif(
-    not check_extension_available(),
-    reason="Native extension not built",
-)
+# Skip the whole module at collection time if native extension is not available
+pytest.importorskip("pyetwkit_core", reason="Native extension not built")
 
 
 class TestMultiSessionBasics:
@@ -132,6 +118,15 @@ class TestMultiSessionProviderManagement:
         )
         assert len(manager.sessions) >= 1
 
+    def test_add_provider_invalid_guid_creates_no_session(self) -> None:
+        """Test that an invalid GUID is rejected before a session is created."""
+        from pyetwkit import MultiSession
+
+        manager = MultiSession()
+        with pytest.raises(ValueError):
+            manager.add_provider("not-a-valid-guid")
+        assert len(manager.sessions) == 0
+
 
 class TestMultiSessionKernel:
     """Tests for MultiSession kernel session support."""
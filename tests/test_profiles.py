@@ -72,7 +72,7 @@ class TestBuiltinProfiles:
 
         profiles = list_profiles()
         assert len(profiles) >= 4
-        names = [p.name for p in profiles]
+        names = {p.name for p in profiles}
         assert "audio" in names
         assert "network" in names
 
@@ -80,39 +80,62 @@ class TestBuiltinProfiles:
 class TestProfileStructure:
     """Tests for Profile data structure."""
 
-    def test_profile_has_name(self) -> None:
+    def test_profile_has_name(self, builtin_profiles: dict) -> None:
         """Test that Profile has name attribute."""
-        from pyetwkit.profiles import get_profile
-
-        profile = get_profile("audio")
+        profile = builtin_profiles["audio"]
         assert hasattr(profile, "name")
         assert isinstance(profile.name, str)
 
-    def test_profile_has_description(self) -> None:
+    def test_profile_has_description(self, builtin_profiles: dict) -> None:
         """Test that Profile has description attribute."""
-        from pyetwkit.profiles import get_profile
-
-        profile = get_profile("audio")
+        profile = builtin_profiles["audio"]
         assert hasattr(profile, "description")
 
-    def test_profile_has_providers(self) -> None:
-        """Test that Profile has providers list."""
-        from pyetwkit.profiles import get_profile
-
-        profile = get_profile("audio")
+    def test_profile_has_providers(self, builtin_profiles: dict) -> None:
+        """Test that Profile has a providers tuple."""
+        profile = builtin_profiles["audio"]
         assert hasattr(profile, "providers")
-        assert isinstance(profile.providers, list)
+        assert isinstance(profile.providers, tuple)
         assert len(profile.providers) > 0
 
-    def test_provider_entry_has_required_fields(self) -> None:
+    def test_provider_entry_has_required_fields(self, builtin_profiles: dict) -> None:
         """Test that provider entry has required fields."""
-        from pyetwkit.profiles import get_profile
-
-        profile = get_profile("audio")
+        profile = builtin_profiles["audio"]
         provider = profile.providers[0]
         # Should have name or guid
         assert hasattr(provider, "name") or hasattr(provider, "guid")
 
+    def test_builtin_profile_is_immutable(self) -> None:
+        """Test that shared built-in profiles cannot be modified in place."""
+        from dataclasses import FrozenInstanceError
+
+        import pytest
+
+        from pyetwkit.profiles import get_profile
+
+        profile = get_profile("audio")
+        with pytest.raises(FrozenInstanceError):
+            profile.description = "changed"
+        with pytest.raises(FrozenInstanceError):
+            profile.providers[0].level = "critical"
+
+    def test_profile_is_hashable(self) -> None:
+        """Test that frozen profiles can be hashed and used as set members."""
+        from pyetwkit.profiles import get_profile, list_profiles
+
+        assert get_profile("audio") in set(list_profiles())
+
+    def test_registered_providers_are_copied(self) -> None:
+        """Test that changing the caller's list leaves a registered profile alone."""
+        from pyetwkit.profiles import Profile, ProviderConfig, get_profile, register_profile
+
+        providers = [ProviderConfig(name="Microsoft-Windows-Kernel-Process")]
+        register_profile(Profile(name="copied_providers", providers=providers))
+        providers.append(ProviderConfig(name="Microsoft-Windows-DNS-Client"))
+
+        profile = get_profile("copied_providers")
+        assert profile.providers == (ProviderConfig(name="Microsoft-Windows-Kernel-Process"),)
+
 
 class TestCustomProfiles:
     """Tests for custom profile loading."""
@@ -135,6 +158,17 @@ providers:
         assert profile.name == "test_profile"
         assert len(profile.providers) == 1
 
+    def test_load_profile_reloads_modified_file(self, tmp_path: Path) -> None:
+        """Test that a cached profile is parsed again after the file changes."""
+        from pyetwkit.profiles import load_profile
+
+        yaml_file = tmp_path / "reload_profile.yaml"
+        yaml_file.write_text("name: reload_profile\ndescription: before\n")
+        assert load_profile(yaml_file).providers == ()
+
+        yaml_file.write_text("name: reload_profile\ndescription: after edit\n")
+        assert load_profile(yaml_file).description == "after edit"
+
     def test_load_profile_from_dict(self) -> None:
         """Test loading profile from dictionary."""
         from pyetwkit.profiles import Profile
@@ -159,11 +193,9 @@ providers:
 class TestProfileProviderConfig:
     """Tests for provider configuration in profiles."""
 
-    def test_provider_config_has_level(self) -> None:
+    def test_provider_config_has_level(self, builtin_profiles: dict) -> None:
         """Test that provider config can have level."""
-        from pyetwkit.profiles import get_profile
-
-        profile = get_profile("audio")
+        profile = builtin_profiles["audio"]
         provider = profile.providers[0]
         # Level should be accessible
         assert (
@@ -172,11 +204,21 @@ class TestProfileProviderConfig:
             or isinstance(provider.level, (str, int))
         )
 
-    def test_provider_config_has_keywords(self) -> None:
-        """Test that provider config can have keywords."""
-        from pyetwkit.profiles import get_profile
+    def test_provider_config_level_value(self) -> None:
+        """Test that level names and numbers resolve to numeric trace levels."""
+        import pytest
 
-        profile = get_profile("process")
+        from pyetwkit.profiles import ProviderConfig
+
+        assert ProviderConfig(name="p", level="verbose").level_value == 5
+        assert ProviderConfig(name="p", level="Information").level_value == 4
+        assert ProviderConfig(name="p", level=2).level_value == 2
+        with pytest.raises(ValueError):
+            _ = ProviderConfig(name="p", level="loud").level_value
+
+    def test_provider_config_has_keywords(self, builtin_profiles: dict) -> None:
+        """Test that provider config can have keywords."""
+        profile = builtin_profiles["process"]
         provider = profile.providers[0]
         # Keywords should be accessible (may be None)
         assert hasattr(provider, "keywords")
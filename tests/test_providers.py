@@ -69,6 +69,12 @@ class TestFileProvider:
         """Test NTFS GUID is valid."""
         assert FileProvider.NTFS == "dd70bc80-ef44-421b-8ac3-cd31da613a4e"
 
+    def test_shared_guids_reuse_kernel_constants(self) -> None:
+        """Test that GUIDs shared between factories are the same objects."""
+        assert FileProvider.KERNEL_FILE is KernelProvider.KERNEL_FILE
+        assert RegistryProvider.KERNEL_REGISTRY is KernelProvider.KERNEL_REGISTRY
+        assert ProcessProvider.PROCESS_GUID is KernelProvider.KERNEL_PROCESS
+
 
 class TestRegistryProvider:
     """Tests for RegistryProvider factory."""
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import json
-import tempfile
+import os
+import stat
+import sys
 from pathlib import Path
 
+import pytest
+
 
 class TestRecorder:
     """Tests for Recorder class."""
@@ -16,42 +20,174 @@ class TestRecorder:
 
         assert Recorder is not None
 
-    def test_recorder_can_be_created(self) -> None:
+    def test_recorder_can_be_created(self, tmp_path: Path) -> None:
         """Test that Recorder can be instantiated."""
         from pyetwkit.recording import Recorder
 
-        with tempfile.NamedTemporaryFile(suffix=".etwpack", delete=False) as f:
-            recorder = Recorder(f.name)
-            assert recorder is not None
-            assert recorder.output_path == Path(f.name)
+        output = tmp_path / "session.etwpack"
+        recorder = Recorder(output)
+        assert recorder is not None
+        assert recorder.output_path == output
 
-    def test_recorder_add_provider(self) -> None:
+    def test_recorder_add_provider(self, tmp_path: Path) -> None:
         """Test adding a provider to the recorder."""
         from pyetwkit.recording import Recorder
 
-        with tempfile.NamedTemporaryFile(suffix=".etwpack", delete=False) as f:
-            recorder = Recorder(f.name)
-            recorder.add_provider("22fb2cd6-0e7b-422b-a0c7-2fad1fd0e716")
-            assert len(recorder.providers) == 1
+        recorder = Recorder(tmp_path / "session.etwpack")
+        recorder.add_provider("22fb2cd6-0e7b-422b-a0c7-2fad1fd0e716")
+        assert len(recorder.providers) == 1
 
-    def test_recorder_start_stop(self) -> None:
+    def test_recorder_start_stop(self, tmp_path: Path) -> None:
         """Test recorder start and stop methods."""
         from pyetwkit.recording import Recorder
 
-        with tempfile.NamedTemporaryFile(suffix=".etwpack", delete=False) as f:
-            recorder = Recorder(f.name)
-            assert hasattr(recorder, "start")
-            assert hasattr(recorder, "stop")
-            assert hasattr(recorder, "is_recording")
+        recorder = Recorder(tmp_path / "session.etwpack")
+        assert hasattr(recorder, "start")
+        assert hasattr(recorder, "stop")
+        assert hasattr(recorder, "is_recording")
 
-    def test_recorder_context_manager(self) -> None:
+    def test_recorder_context_manager(self, tmp_path: Path) -> None:
         """Test recorder as context manager."""
         from pyetwkit.recording import Recorder
 
-        with tempfile.NamedTemporaryFile(suffix=".etwpack", delete=False) as f:
-            recorder = Recorder(f.name)
-            assert hasattr(recorder, "__enter__")
-            assert hasattr(recorder, "__exit__")
+        recorder = Recorder(tmp_path / "session.etwpack")
+        assert hasattr(recorder, "__enter__")
+        assert hasattr(recorder, "__exit__")
+
+    def test_recording_round_trip(self, tmp_path: Path) -> None:
+        """Test that recorded events are read back by the Player."""
+        from unittest.mock import MagicMock
+
+        from pyetwkit.recording import Player, Recorder
+
+        output = tmp_path / "session.etwpack"
+        with Recorder(output) as recorder:
+            recorder.add_provider("22fb2cd6-0e7b-422b-a0c7-2fad1fd0e716")
+            for i in range(2500):
+                event = MagicMock()
+                event.event_id = i % 3
+                event.provider_name = "TestProvider"
+                event.timestamp = float(i)
+                event.process_id = 1234
+                event.properties = {"index": i}
+                recorder.add_event(event)
+
+        player = Player(output)
+        assert player.event_count == 2500
+        events = list(player.events())
+        assert len(events) == 2500
+        assert events[2499]["properties"] == {"index": 2499}
+        assert len(list(player.events(event_id=1))) == 833
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_recording_non_str_property_keys(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """Test that non-str property keys are written as strings by either encoder."""
+        from unittest.mock import MagicMock
+
+        from pyetwkit import _json
+        from pyetwkit.recording import Player, Recorder
+
+        if not use_orjson:
+            monkeypatch.setattr(_json, "orjson", None)
+        elif _json.orjson is None:
+            pytest.skip("orjson not installed")
+
+        output = tmp_path / "session.etwpack"
+        with Recorder(output) as recorder:
+            event = MagicMock()
+            event.event_id = 1
+            event.provider_name = "TestProvider"
+            event.timestamp = 0.0
+            event.process_id = 1234
+            event.properties = {1: "one", "name": "value"}
+            recorder.add_event(event)
+
+        events = list(Player(output).events())
+        assert events[0]["properties"] == {"1": "one", "name": "value"}
+
+    def test_failed_write_keeps_previous_recording(self, tmp_path: Path) -> None:
+        """Test that an unencodable event leaves the existing file untouched."""
+        from unittest.mock import MagicMock
+
+        from pyetwkit.recording import Recorder
+
+        output = tmp_path / "session.etwpack"
+        output.write_text("previous recording")
+
+        recorder = Recorder(output).start()
+        event = MagicMock()
+        event.event_id = 1
+        event.provider_name = "TestProvider"
+        event.timestamp = 0.0
+        event.process_id = 1234
+        event.properties = {"payload": b"\x00\x01"}  # Binary properties are not JSON
+        recorder.add_event(event)
+        with pytest.raises(TypeError):
+            recorder.stop()
+
+        assert output.read_text() == "previous recording"
+        assert list(tmp_path.iterdir()) == [output]
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_recording_is_indented(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """Test that the streamed file matches an indented dump of the document."""
+        from unittest.mock import MagicMock
+
+        from pyetwkit import _json
+        from pyetwkit.recording import Recorder
+
+        if not use_orjson:
+            monkeypatch.setattr(_json, "orjson", None)
+        elif _json.orjson is None:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr("pyetwkit.recording._WRITE_BATCH_SIZE", 2)
+
+        output = tmp_path / "session.etwpack"
+        with Recorder(output) as recorder:
+            recorder.add_provider("22fb2cd6-0e7b-422b-a0c7-2fad1fd0e716")
+            for i in range(5):
+                event = MagicMock()
+                event.event_id = i
+                event.provider_name = "TestProvider"
+                event.timestamp = float(i)
+                event.process_id = 1234
+                event.properties = {"index": i, "empty": {}}
+                recorder.add_event(event)
+
+        text = output.read_text(encoding="utf-8")
+        assert text == json.dumps(json.loads(text), indent=2, ensure_ascii=False) + "\n"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+    def test_recording_mode(self, tmp_path: Path) -> None:
+        """Test that a new recording follows the umask and a rewrite keeps the mode."""
+        from unittest.mock import MagicMock
+
+        from pyetwkit.recording import Recorder
+
+        event = MagicMock()
+        event.event_id = 1
+        event.provider_name = "TestProvider"
+        event.timestamp = 0.0
+        event.process_id = 1234
+        event.properties = {}
+
+        output = tmp_path / "session.etwpack"
+        old_umask = os.umask(0o022)
+        try:
+            with Recorder(output) as recorder:
+                recorder.add_event(event)
+        finally:
+            os.umask(old_umask)
+        assert stat.S_IMODE(output.stat().st_mode) == 0o644
+
+        output.chmod(0o640)
+        with Recorder(output) as recorder:
+            recorder.add_event(event)
+        assert stat.S_IMODE(output.stat().st_mode) == 0o640
 
 
 class TestPlayer:
@@ -200,6 +336,28 @@ class TestPlayerFiltering:
 
         assert hasattr(Player, "events")
 
+    def test_player_combined_filters_after_seek(self, tmp_path: Path) -> None:
+        """Test that filters combine and apply from the seek position."""
+        from unittest.mock import MagicMock
+
+        from pyetwkit.recording import Player, Recorder
+
+        output = tmp_path / "filtered.etwpack"
+        with Recorder(output) as recorder:
+            for i in range(20):
+                event = MagicMock()
+                event.event_id = i % 2
+                event.provider_name = "A" if i < 10 else "B"
+                event.timestamp = float(i)
+                event.process_id = 1
+                event.properties = {}
+                recorder.add_event(event)
+
+        player = Player(output).seek(position=5)
+        assert len(list(player.events())) == 15
+        matched = player.events(provider="A", event_id=1, start_time=6.0, end_time=9.0)
+        assert [e["timestamp"] for e in matched] == [7.0, 9.0]
+
 
 class TestPlaybackSpeed:
     """Tests for playback speed control."""
@@ -234,6 +392,21 @@ class TestEtwpackIndex:
         assert hasattr(index, "find_offset")
         assert hasattr(index, "add_entry")
 
+    def test_etwpack_index_find_offset(self) -> None:
+        """Test that find_offset returns the first entry at or after a timestamp."""
+        from pyetwkit.recording import EtwpackIndex
+
+        index = EtwpackIndex()
+        assert index.find_offset(1.0) is None
+
+        for timestamp, offset in [(1.0, 100), (2.0, 200), (3.5, 350)]:
+            index.add_entry(timestamp, offset)
+
+        assert index.find_offset(0.0) == 100
+        assert index.find_offset(1.5) == 200
+        assert index.find_offset(3.5) == 350
+        assert index.find_offset(10.0) == 350
+
 
 class TestETLConversion:
     """Tests for ETL to etwpack conversion."""
@@ -244,6 +417,21 @@ class TestETLConversion:
 
         assert convert_etl_to_etwpack is not None
 
+    def test_convert_writes_indented_json(self, tmp_path: Path) -> None:
+        """Test that conversion writes an indented document through the shared encoder."""
+        from pyetwkit.recording import EtwpackHeader, convert_etl_to_etwpack
+
+        source = tmp_path / "trace.etl"
+        source.write_bytes(b"")
+        destination = tmp_path / "trace.etwpack"
+        convert_etl_to_etwpack(source, destination)
+
+        text = destination.read_text(encoding="utf-8")
+        data = json.loads(text)
+        assert text == json.dumps(data, indent=2, ensure_ascii=False)
+        assert data["events"] == []
+        assert EtwpackHeader.from_dict(data["header"]).event_count == 0
+
     def test_convert_etl_parameters(self) -> None:
         """Test convert function parameters."""
         # Should accept source and destination paths
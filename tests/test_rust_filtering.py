@@ -2,24 +2,13 @@
 
 from __future__ import annotations
 
-import pytest
-
-
-def check_extension_available() -> bool:
-    """Check if native extension is available."""
-    try:
-        import pyetwkit_core  # noqa: F401
-
-        return True
-    except ImportError:
-        return False
+import importlib
 
+import pytest
 
-# Skip all tests if native extension is not available
-pytestmark = pytest.mark.skipif(
-    not check_extension_available(),
-    reason="Native extension not built",
-)
+# Skip the whole module at collection time if native extension is not available
+pytest.importorskip("pyetwkit_core", reason="Native extension not built")
+rust_filter = importlib.import_module("pyetwkit.rust_filter")
 
 
 class TestRustEventFilter:
@@ -27,175 +16,142 @@ class TestRustEventFilter:
 
     def test_rust_event_filter_exists(self) -> None:
         """Test that RustEventFilter class exists."""
-        from pyetwkit import RustEventFilter
-
-        assert RustEventFilter is not None
+        assert rust_filter.RustEventFilter is not None
 
     def test_rust_event_filter_can_be_created(self) -> None:
         """Test that RustEventFilter can be instantiated."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter()
-        assert filter is not None
-
-    def test_rust_event_filter_event_ids(self) -> None:
-        """Test filtering by event IDs."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().event_ids([1, 2, 3])
-        assert filter is not None
-
-    def test_rust_event_filter_exclude_event_ids(self) -> None:
-        """Test excluding event IDs."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().exclude_event_ids([100, 200])
-        assert filter is not None
-
-    def test_rust_event_filter_level(self) -> None:
-        """Test filtering by level."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().level_max(4)  # Info and above
+        filter = rust_filter.RustEventFilter()
         assert filter is not None
 
-    def test_rust_event_filter_keywords(self) -> None:
-        """Test filtering by keywords."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().keywords_any(0x10)
-        assert filter is not None
-
-    def test_rust_event_filter_pid(self) -> None:
-        """Test filtering by process ID."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().pid(1234)
+    @pytest.mark.parametrize(
+        "call",
+        [
+            ("event_ids", ([1, 2, 3],)),
+            ("exclude_event_ids", ([100, 200],)),
+            ("level_max", (4,)),  # Info and above
+            ("keywords_any", (0x10,)),
+            ("pid", (1234,)),
+        ],
+        ids=lambda call: call[0],
+    )
+    def test_rust_event_filter_builder(self, call: tuple[str, tuple]) -> None:
+        """Test that each builder method returns a filter."""
+        method, args = call
+        filter = getattr(rust_filter.RustEventFilter(), method)(*args)
         assert filter is not None
 
     def test_rust_event_filter_chaining(self) -> None:
         """Test that filter methods can be chained."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().event_ids([1, 2]).level_max(4).pid(1234)
+        filter = rust_filter.RustEventFilter().event_ids([1, 2]).level_max(4).pid(1234)
         assert filter is not None
 
 
 class TestRustPropertyFiltering:
     """Tests for Rust-side property filtering."""
 
-    def test_property_equals(self) -> None:
-        """Test property equals filter."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().property_equals("ProcessId", 1234)
+    @pytest.mark.parametrize(
+        "call",
+        [
+            ("property_equals", ("ProcessId", 1234)),
+            ("property_contains", ("ImageFileName", "chrome")),
+            ("property_regex", ("CommandLine", r"--type=renderer")),
+            ("property_gt", ("ProcessId", 100)),
+            ("property_lt", ("ProcessId", 10000)),
+        ],
+        ids=lambda call: call[0],
+    )
+    def test_property_filter(self, call: tuple[str, tuple]) -> None:
+        """Test that each property filter method returns a filter."""
+        method, args = call
+        filter = getattr(rust_filter.RustEventFilter(), method)(*args)
         assert filter is not None
 
-    def test_property_contains(self) -> None:
-        """Test property contains filter."""
-        from pyetwkit import RustEventFilter
 
-        filter = RustEventFilter().property_contains("ImageFileName", "chrome")
-        assert filter is not None
-
-    def test_property_regex(self) -> None:
-        """Test property regex filter."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().property_regex("CommandLine", r"--type=renderer")
-        assert filter is not None
-
-    def test_property_greater_than(self) -> None:
-        """Test property greater than filter."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().property_gt("ProcessId", 100)
-        assert filter is not None
-
-    def test_property_less_than(self) -> None:
-        """Test property less than filter."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().property_lt("ProcessId", 10000)
-        assert filter is not None
+@pytest.fixture(scope="module")
+def filter_pair() -> tuple[rust_filter.RustEventFilter, rust_filter.RustEventFilter]:
+    """Two prebuilt filters; the combination operators leave their operands untouched."""
+    return rust_filter.RustEventFilter().event_ids([1, 2]), rust_filter.RustEventFilter().pid(1234)
 
 
 class TestFilterCombinations:
     """Tests for combining filters."""
 
-    def test_filter_and(self) -> None:
+    def test_filter_and(
+        self, filter_pair: tuple[rust_filter.RustEventFilter, rust_filter.RustEventFilter]
+    ) -> None:
         """Test AND combination of filters."""
-        from pyetwkit import RustEventFilter
-
-        filter1 = RustEventFilter().event_ids([1, 2])
-        filter2 = RustEventFilter().pid(1234)
+        filter1, filter2 = filter_pair
 
         combined = filter1 & filter2
         assert combined is not None
 
-    def test_filter_or(self) -> None:
+    def test_filter_or(
+        self, filter_pair: tuple[rust_filter.RustEventFilter, rust_filter.RustEventFilter]
+    ) -> None:
         """Test OR combination of filters."""
-        from pyetwkit import RustEventFilter
-
-        filter1 = RustEventFilter().event_ids([1])
-        filter2 = RustEventFilter().event_ids([2])
+        filter1, filter2 = filter_pair
 
         combined = filter1 | filter2
         assert combined is not None
 
-    def test_filter_not(self) -> None:
+    def test_filter_not(
+        self, filter_pair: tuple[rust_filter.RustEventFilter, rust_filter.RustEventFilter]
+    ) -> None:
         """Test NOT operation on filter."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().event_ids([100, 200])
+        filter, _ = filter_pair
         inverted = ~filter
         assert inverted is not None
 
 
+@pytest.fixture(scope="module")
+def built_filter() -> tuple[rust_filter.RustEventFilter, bytes]:
+    """A two-spec filter and its serialized form, built once for the module."""
+    filter = rust_filter.RustEventFilter().event_ids([1, 2]).pid(1234)
+    return filter, filter.to_bytes()
+
+
 class TestFilterIntegration:
     """Tests for filter integration with sessions."""
 
-    def test_rust_filter_can_be_created_for_session(self) -> None:
+    def test_rust_filter_can_be_created_for_session(
+        self, built_filter: tuple[rust_filter.RustEventFilter, bytes]
+    ) -> None:
         """Test that RustEventFilter can be created for use with sessions."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().event_ids([1, 2])
+        filter, data = built_filter
 
         # Filter should be ready for Rust-side evaluation
         assert filter.is_rust_filter
-        assert filter.to_bytes() is not None
+        assert data is not None
 
-    def test_filter_integration_ready(self) -> None:
+    def test_filter_integration_ready(
+        self, built_filter: tuple[rust_filter.RustEventFilter, bytes]
+    ) -> None:
         """Test that filter is ready for session integration."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().event_ids([1, 2]).pid(1234)
+        _, data = built_filter
 
-        # Filter should have serialized representation
-        data = filter.to_bytes()
-        assert len(data) > 0
-        # Version byte should be 1
-        assert data[0] == 1
+        # Header: version 1, no flags, two specs (u16 little-endian)
+        assert data[:4] == b"\x01\x00\x02\x00"
 
 
 class TestFilterPerformance:
     """Tests for filter performance characteristics."""
 
-    def test_filter_is_evaluated_in_rust(self) -> None:
+    def test_filter_is_evaluated_in_rust(
+        self, built_filter: tuple[rust_filter.RustEventFilter, bytes]
+    ) -> None:
         """Test that filter is marked for Rust evaluation."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().event_ids([1, 2])
+        filter, _ = built_filter
         # Filter should have a flag or method indicating Rust-side evaluation
         assert hasattr(filter, "is_rust_filter") or hasattr(filter, "_rust_handle")
 
-    def test_filter_serialization(self) -> None:
+    def test_filter_serialization(
+        self, built_filter: tuple[rust_filter.RustEventFilter, bytes]
+    ) -> None:
         """Test that filter can be serialized for Rust."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter().event_ids([1, 2]).pid(1234)
+        filter, data = built_filter
         # Filter should be serializable
         assert hasattr(filter, "to_bytes") or hasattr(filter, "_serialize")
+        assert isinstance(data, bytes)
 
 
 class TestFilterValidation:
@@ -203,22 +159,16 @@ class TestFilterValidation:
 
     def test_invalid_event_id(self) -> None:
         """Test that invalid event IDs raise error."""
-        from pyetwkit import RustEventFilter
-
         with pytest.raises((ValueError, TypeError)):
-            RustEventFilter().event_ids([-1])  # Negative ID invalid
+            rust_filter.RustEventFilter().event_ids([-1])  # Negative ID invalid
 
     def test_invalid_regex(self) -> None:
         """Test that invalid regex raises error."""
-        from pyetwkit import RustEventFilter
-
         with pytest.raises((ValueError, RuntimeError)):
-            RustEventFilter().property_regex("Field", "[invalid")  # Unclosed bracket
+            rust_filter.RustEventFilter().property_regex("Field", "[invalid")  # Unclosed bracket
 
     def test_empty_filter(self) -> None:
         """Test that empty filter is valid (matches all)."""
-        from pyetwkit import RustEventFilter
-
-        filter = RustEventFilter()
+        filter = rust_filter.RustEventFilter()
         # Empty filter should be valid
         assert filter is not None
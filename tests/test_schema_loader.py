@@ -2,22 +2,11 @@
 
 import pytest
 
+# Skip the whole module at collection time if native extension is not available
+pyetwkit_core = pytest.importorskip("pyetwkit_core", reason="Native extension not built")
 
-def check_extension_available() -> bool:
-    """Check if native extension is available."""
-    try:
-        import pyetwkit_core  # noqa: F401
-
-        return True
-    except ImportError:
-        return False
-
-
-# Skip all tests if native extension is not available
-pytestmark = pytest.mark.skipif(
-    not check_extension_available(),
-    reason="Native extension not built",
-)
+# Attribute names for feature checks, gathered once instead of per hasattr()
+CORE_ATTRS = frozenset(dir(pyetwkit_core))
 
 
 class TestEventSchema:
@@ -25,17 +14,13 @@ class TestEventSchema:
 
     def test_event_schema_class_exists(self) -> None:
         """Test that EventSchema class exists."""
-        import pyetwkit_core
-
-        assert hasattr(pyetwkit_core, "EventSchema")
+        assert "EventSchema" in CORE_ATTRS
 
     def test_event_schema_has_properties(self) -> None:
         """Test that EventSchema has properties attribute."""
-        import pyetwkit_core
-
         # Check class definition
-        schema_class = pyetwkit_core.EventSchema
-        assert hasattr(schema_class, "properties") or hasattr(schema_class, "property_names")
+        schema_attrs = frozenset(dir(pyetwkit_core.EventSchema))
+        assert {"properties", "property_names"} & schema_attrs
 
 
 class TestSchemaLocator:
@@ -43,10 +28,8 @@ class TestSchemaLocator:
 
     def test_schema_locator_exists(self) -> None:
         """Test that SchemaCache or EventSchema exists."""
-        import pyetwkit_core
-
         # SchemaCache serves as the locator/cache
-        assert hasattr(pyetwkit_core, "SchemaCache") or hasattr(pyetwkit_core, "EventSchema")
+        assert {"SchemaCache", "EventSchema"} & CORE_ATTRS
 
 
 class TestPropertyInfo:
@@ -54,15 +37,11 @@ class TestPropertyInfo:
 
     def test_property_info_exists(self) -> None:
         """Test that PropertyInfo class exists."""
-        import pyetwkit_core
-
-        assert hasattr(pyetwkit_core, "PropertyInfo")
+        assert "PropertyInfo" in CORE_ATTRS
 
     def test_property_info_has_name(self) -> None:
         """Test that PropertyInfo has name attribute."""
-        import pyetwkit_core
-
-        if hasattr(pyetwkit_core, "PropertyInfo"):
+        if "PropertyInfo" in CORE_ATTRS:
             # Check class attributes
             prop_class = pyetwkit_core.PropertyInfo
             # Name should be accessible
@@ -70,9 +49,7 @@ class TestPropertyInfo:
 
     def test_property_info_has_type(self) -> None:
         """Test that PropertyInfo has type information."""
-        import pyetwkit_core
-
-        if hasattr(pyetwkit_core, "PropertyInfo"):
+        if "PropertyInfo" in CORE_ATTRS:
             prop_class = pyetwkit_core.PropertyInfo
             assert prop_class is not None
 
@@ -82,15 +59,8 @@ class TestSchemaCache:
 
     def test_schema_cache_exists(self) -> None:
         """Test that schema caching is available."""
-        import pyetwkit_core
-
         # Either a cache class or caching built into SchemaLocator
-        has_cache = (
-            hasattr(pyetwkit_core, "SchemaCache")
-            or hasattr(pyetwkit_core, "clear_schema_cache")
-            or hasattr(pyetwkit_core, "SchemaLocator")
-        )
-        assert has_cache
+        assert {"SchemaCache", "clear_schema_cache", "SchemaLocator"} & CORE_ATTRS
 
 
 class TestEventProperties:
@@ -98,15 +68,11 @@ class TestEventProperties:
 
     def test_event_has_properties_dict(self) -> None:
         """Test that EtwEvent has properties as dict."""
-        import pyetwkit_core
-
         event_class = pyetwkit_core.EtwEvent
         assert hasattr(event_class, "properties")
 
     def test_event_property_access(self) -> None:
         """Test that event properties can be accessed."""
-        import pyetwkit_core
-
         event_class = pyetwkit_core.EtwEvent
         # The properties attribute should exist
-        assert hasattr(event_class, "properties") or hasattr(event_class, "get_property")
+        assert {"properties", "get_property"} & frozenset(dir(event_class))
@@ -2,22 +2,8 @@
 
 import pytest
 
-
-def check_extension_available() -> bool:
-    """Check if native extension is available."""
-    try:
-        from pyetwkit import _core  # noqa: F401
-
-        return True
-    except ImportError:
-        return False
-
-
-# Skip all tests if native extension is not available
-pytestmark = pytest.mark.skipif(
-    not check_extension_available(),
-    reason="Native extension not built",
-)
+# Skip the whole module at collection time if native extension is not available
+_core = pytest.importorskip("pyetwkit._core", reason="Native extension not built")
 
 
 class TestEnableProperty:
@@ -25,28 +11,23 @@ class TestEnableProperty:
 
     def test_enable_property_exists(self) -> None:
         """Test that EnableProperty exists."""
-        from pyetwkit import _core
-
         assert hasattr(_core, "EnableProperty")
 
     def test_enable_property_stack_trace(self) -> None:
         """Test that STACK_TRACE flag exists."""
-        from pyetwkit._core import EnableProperty
-
-        assert hasattr(EnableProperty, "STACK_TRACE") or hasattr(EnableProperty, "StackTrace")
+        enable_attrs = frozenset(dir(_core.EnableProperty))
+        assert {"STACK_TRACE", "StackTrace"} & enable_attrs
 
     def test_enable_property_values(self) -> None:
         """Test EnableProperty flag values."""
-        from pyetwkit._core import EnableProperty
-
+        enable_attrs = frozenset(dir(_core.EnableProperty))
         # Should have common enable properties
         expected_flags = ["STACK_TRACE", "SID", "TS_ID", "PROCESS_START_KEY"]
-        found_flags = []
-        for flag in expected_flags:
-            if hasattr(EnableProperty, flag) or hasattr(
-                EnableProperty, flag.title().replace("_", "")
-            ):
-                found_flags.append(flag)
+        found_flags = [
+            flag
+            for flag in expected_flags
+            if flag in enable_attrs or flag.title().replace("_", "") in enable_attrs
+        ]
         # At least STACK_TRACE should exist
         assert len(found_flags) >= 1
 
@@ -56,11 +37,8 @@ class TestStackTraceCapture:
 
     def test_session_with_stack_trace_option(self) -> None:
         """Test creating session with stack trace enabled."""
-        from pyetwkit import _core
-        from pyetwkit._core import EtwSession
-
         # Should be able to create session with stack trace option
-        session = EtwSession("StackTraceTest")
+        session = _core.EtwSession("StackTraceTest")
         assert session is not None
         # Check if enable_stack_trace method or option exists
         has_stack_option = (
@@ -72,12 +50,10 @@ class TestStackTraceCapture:
 
     def test_event_has_stack_property(self) -> None:
         """Test that EtwEvent has stack trace property."""
-        from pyetwkit._core import EtwEvent
-
         # Check EtwEvent class has stack-related attribute
         # Should have stack_trace or stack attribute
         # This is checking the class definition, not instance
-        assert hasattr(EtwEvent, "stack_trace") or hasattr(EtwEvent, "stack")
+        assert {"stack_trace", "stack"} & frozenset(dir(_core.EtwEvent))
 
 
 class TestStackFrame:
@@ -85,11 +61,8 @@ class TestStackFrame:
 
     def test_stack_frame_exists(self) -> None:
         """Test that StackFrame class exists (if stack traces are supported)."""
-        from pyetwkit import _core
-        from pyetwkit._core import EtwEvent
-
         # StackFrame might be a separate class or part of event
-        has_stack_support = hasattr(_core, "StackFrame") or hasattr(EtwEvent, "stack_trace")
+        has_stack_support = hasattr(_core, "StackFrame") or hasattr(_core.EtwEvent, "stack_trace")
         assert has_stack_support
 
 
@@ -99,10 +72,8 @@ class TestStackTraceIntegration:
 
     def test_capture_events_with_stack_trace(self) -> None:
         """Test capturing events with stack trace enabled."""
-        from pyetwkit._core import EtwProvider, EtwSession
-
-        session = EtwSession("StackTraceIntegrationTest")
-        provider = EtwProvider(
+        session = _core.EtwSession("StackTraceIntegrationTest")
+        provider = _core.EtwProvider(
             "22fb2cd6-0e7b-422b-a0c7-2fad1fd0e716",
             "Microsoft-Windows-Kernel-Process",
         )
@@ -117,9 +88,10 @@ class TestStackTraceIntegration:
         try:
             # Try to capture an event with stack trace
             event = session.next_event_timeout(1000)
-            if event and event.stack_trace:
-                assert isinstance(event.stack_trace, list)
-                for frame in event.stack_trace:
-                    assert isinstance(frame, int)  # Stack addresses
+            # The getter builds a new list on every access, so read it once
+            stack = event.stack_trace if event else None
+            if stack:
+                assert isinstance(stack, list)
+                assert all(type(frame) is int for frame in stack)  # Stack addresses
         finally:
             session.stop()
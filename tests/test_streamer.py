@@ -1,59 +1,62 @@
 """Tests for EtwStreamer (asynchronous API)."""
 
+from __future__ import annotations
+
+import asyncio
+import importlib
+import threading
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+
 import pytest
+import pytest_asyncio
 
+# Skip the whole module at collection time if native extension is not available
+pytest.importorskip("pyetwkit_core", reason="Native extension not built")
+pyetwkit = importlib.import_module("pyetwkit")
 
-def check_extension_available() -> bool:
-    """Check if native extension is available."""
-    try:
-        from pyetwkit._core import EtwSession  # noqa: F401
 
-        return True
-    except ImportError:
-        return False
+@pytest.fixture(scope="module")
+def dns_provider() -> pyetwkit.EtwProvider:
+    """DNS client provider; sessions copy providers, so one instance serves every test."""
+    return pyetwkit.EtwProvider.dns_client()
 
 
-# Skip all tests if native extension is not available
-pytestmark = pytest.mark.skipif(
-    not check_extension_available(),
-    reason="Native extension not built",
-)
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def running_streamer(
+    dns_provider: pyetwkit.EtwProvider,
+) -> AsyncIterator[pyetwkit.EtwStreamer]:
+    """Started streamer shared by tests that only read from it."""
+    streamer = pyetwkit.EtwStreamer(providers=[dns_provider])
+    await streamer.start()
+    yield streamer
+    await streamer.stop()
 
 
+@pytest.mark.admin
+# One event loop for the whole module, shared with the module-scoped fixtures
+@pytest.mark.asyncio(loop_scope="module")
 class TestEtwStreamer:
-    """Tests for EtwStreamer class."""
+    """Tests for EtwStreamer class; every test starts a session."""
 
-    @pytest.mark.admin
-    @pytest.mark.asyncio
-    async def test_streamer_creation(self) -> None:
+    async def test_streamer_creation(self, dns_provider: pyetwkit.EtwProvider) -> None:
         """Test creating a streamer."""
-        from pyetwkit import EtwProvider, EtwStreamer
-
-        provider = EtwProvider.dns_client()
-        streamer = EtwStreamer(providers=[provider])
+        streamer = pyetwkit.EtwStreamer(providers=[dns_provider])
         assert streamer.name is not None
         assert not streamer.is_running
 
-    @pytest.mark.admin
-    @pytest.mark.asyncio
-    async def test_streamer_context_manager(self) -> None:
+    async def test_streamer_context_manager(self, dns_provider: pyetwkit.EtwProvider) -> None:
         """Test streamer as async context manager."""
-        from pyetwkit import EtwProvider, EtwStreamer
-
-        provider = EtwProvider.dns_client()
-        async with EtwStreamer(providers=[provider]) as streamer:
+        async with pyetwkit.EtwStreamer(providers=[dns_provider]) as streamer:
             assert streamer.is_running
 
         assert not streamer.is_running
 
-    @pytest.mark.admin
-    @pytest.mark.asyncio
     async def test_streamer_start_stop(self) -> None:
         """Test manual start/stop."""
-        from pyetwkit import EtwProvider, EtwStreamer
-
-        provider = EtwProvider.kernel_process()
-        streamer = EtwStreamer(providers=[provider])
+        provider = pyetwkit.EtwProvider.kernel_process()
+        streamer = pyetwkit.EtwStreamer(providers=[provider])
 
         await streamer.start()
         assert streamer.is_running
@@ -61,14 +64,9 @@ class TestEtwStreamer:
         await streamer.stop()
         assert not streamer.is_running
 
-    @pytest.mark.admin
-    @pytest.mark.asyncio
-    async def test_streamer_double_start(self) -> None:
+    async def test_streamer_double_start(self, dns_provider: pyetwkit.EtwProvider) -> None:
         """Test that double start raises error."""
-        from pyetwkit import EtwProvider, EtwStreamer
-
-        provider = EtwProvider.dns_client()
-        streamer = EtwStreamer(providers=[provider])
+        streamer = pyetwkit.EtwStreamer(providers=[dns_provider])
         await streamer.start()
 
         with pytest.raises(RuntimeError, match="already running"):
@@ -76,54 +74,280 @@ class TestEtwStreamer:
 
         await streamer.stop()
 
-    @pytest.mark.admin
-    @pytest.mark.asyncio
-    async def test_streamer_stats(self) -> None:
+    async def test_streamer_stats(self, running_streamer: pyetwkit.EtwStreamer) -> None:
         """Test getting streamer statistics."""
-        from pyetwkit import EtwProvider, EtwStreamer
+        stats = running_streamer.stats()
+        assert stats.events_received >= 0
+        assert stats.events_lost >= 0
 
-        provider = EtwProvider.dns_client()
-        async with EtwStreamer(providers=[provider]) as streamer:
-            stats = streamer.stats()
-            assert stats.events_received >= 0
-            assert stats.events_lost >= 0
-
-    @pytest.mark.admin
-    @pytest.mark.asyncio
-    async def test_streamer_repr(self) -> None:
+    async def test_streamer_repr(self, dns_provider: pyetwkit.EtwProvider) -> None:
         """Test streamer string representation."""
-        from pyetwkit import EtwProvider, EtwStreamer
-
-        provider = EtwProvider.dns_client()
-        streamer = EtwStreamer(providers=[provider])
+        streamer = pyetwkit.EtwStreamer(providers=[dns_provider])
 
         repr_str = repr(streamer)
         assert "EtwStreamer" in repr_str
         assert "stopped" in repr_str
 
-    @pytest.mark.admin
-    @pytest.mark.asyncio
-    async def test_events_without_start(self) -> None:
+    async def test_events_without_start(self, dns_provider: pyetwkit.EtwProvider) -> None:
         """Test that iterating without start raises error."""
-        from pyetwkit import EtwProvider, EtwStreamer
-
-        provider = EtwProvider.dns_client()
-        streamer = EtwStreamer(providers=[provider])
+        streamer = pyetwkit.EtwStreamer(providers=[dns_provider])
 
         with pytest.raises(RuntimeError, match="not running"):
             async for _ in streamer.events(timeout=1.0, max_events=1):
                 pass
 
-    @pytest.mark.admin
-    @pytest.mark.asyncio
-    async def test_streamer_timeout(self) -> None:
+    async def test_streamer_timeout(self, running_streamer: pyetwkit.EtwStreamer) -> None:
         """Test streamer with timeout."""
-        from pyetwkit import EtwProvider, EtwStreamer
-
-        provider = EtwProvider.dns_client()
-        async with EtwStreamer(providers=[provider]) as streamer:
-            count = 0
-            async for _ in streamer.events(timeout=1.0, max_events=10):
-                count += 1
-            # We may or may not receive events, but no error should occur
-            assert count >= 0
+        count = 0
+        async for _ in running_streamer.events(timeout=1.0, max_events=10):
+            count += 1
+        # We may or may not receive events, but no error should occur
+        assert count >= 0
+
+    async def test_streamer_events_columnar(self) -> None:
+        """Test columnar batches have one equal-length list per column."""
+        provider = pyetwkit.EtwProvider.kernel_process()
+        async with pyetwkit.EtwStreamer(providers=[provider]) as streamer:
+            async for batch in streamer.events_columnar(batch_size=16, timeout=1.0):
+                assert 0 < len(batch["event_id"]) <= 16
+                assert {len(column) for column in batch.values()} == {len(batch["event_id"])}
+
+
+COLUMNS = [
+    "timestamp_ns",
+    "provider_id",
+    "provider_name",
+    "event_id",
+    "process_id",
+    "thread_id",
+    "opcode",
+    "level",
+]
+
+
+class FakeSession:
+    """Stand-in for the native session that hands out a fixed list of events."""
+
+    def __init__(self) -> None:
+        self.name = "fake"
+        self.pending: list[SimpleNamespace] = []
+
+    @classmethod
+    def with_config(cls, **config: Any) -> FakeSession:  # noqa: ARG003
+        return cls()
+
+    def add_provider(self, provider: Any) -> None:
+        pass
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def try_next_event(self) -> SimpleNamespace | None:
+        return self.pending.pop(0) if self.pending else None
+
+    def drain_columnar(self, max_events: int) -> dict[str, list[Any]] | None:
+        drained, self.pending = self.pending[:max_events], self.pending[max_events:]
+        if not drained:
+            return None
+        return {name: [getattr(event, name) for event in drained] for name in COLUMNS}
+
+
+@pytest.fixture
+def fake_streamer(monkeypatch: pytest.MonkeyPatch) -> pyetwkit.EtwStreamer:
+    """Streamer backed by a FakeSession; queue events on streamer._session.pending."""
+    monkeypatch.setattr("pyetwkit.streamer.EtwSession", FakeSession)
+    return pyetwkit.EtwStreamer(providers=[])
+
+
+def make_event(i: int) -> SimpleNamespace:
+    """Build an event whose header fields are derived from i."""
+    return SimpleNamespace(
+        timestamp_ns=1_000 + i,
+        provider_id="22fb2cd6-0e7b-422b-a0c7-2fad1fd0e716",
+        provider_name="Microsoft-Windows-Kernel-Process",
+        event_id=i,
+        process_id=100 + i,
+        thread_id=200 + i,
+        opcode=i % 3,
+        level=4,
+    )
+
+
+class TestIdlePolling:
+    """Tests for the idle back-off with a fractional poll interval."""
+
+    @pytest.fixture
+    def streamer(self, monkeypatch: pytest.MonkeyPatch) -> pyetwkit.EtwStreamer:
+        monkeypatch.setattr("pyetwkit.streamer.EtwSession", FakeSession)
+        return pyetwkit.EtwStreamer(providers=[], poll_interval_ms=0.5)
+
+    async def test_events_float_interval(self, streamer: pyetwkit.EtwStreamer) -> None:
+        """Test that events() backs off while idle with a float interval."""
+        async with streamer:
+            events = [event async for event in streamer.events(timeout=0.05)]
+        assert events == []
+
+    async def test_anext_float_interval(self, streamer: pyetwkit.EtwStreamer) -> None:
+        """Test that iterating the streamer waits out idle polls with a float interval."""
+        event = make_event(1)
+        async with streamer:
+            asyncio.get_running_loop().call_later(0.02, streamer._session.pending.append, event)
+            assert await asyncio.wait_for(streamer.__anext__(), timeout=1.0) is event
+
+    async def test_columnar_float_interval(self, streamer: pyetwkit.EtwStreamer) -> None:
+        """Test that events_columnar() backs off while idle with a float interval."""
+        async with streamer:
+            batches = [batch async for batch in streamer.events_columnar(timeout=0.05)]
+        assert batches == []
+
+
+class TestEventsColumnar:
+    """Tests for EtwStreamer.events_columnar() against a fake session."""
+
+    async def test_columnar_batches(self, fake_streamer: pyetwkit.EtwStreamer) -> None:
+        """Test that batch_size is passed to the session drain and batches keep their order."""
+        fake_streamer._session.pending = [make_event(i) for i in range(10)]
+        async with fake_streamer:
+            batches = [
+                batch async for batch in fake_streamer.events_columnar(batch_size=4, timeout=0.2)
+            ]
+
+        assert [len(batch["event_id"]) for batch in batches] == [4, 4, 2]
+        for batch in batches:
+            assert list(batch) == COLUMNS
+            assert {len(column) for column in batch.values()} == {len(batch["event_id"])}
+
+        def column(name: str) -> list[Any]:
+            return [value for batch in batches for value in batch[name]]
+
+        assert column("event_id") == list(range(10))
+        assert column("timestamp_ns") == [1_000 + i for i in range(10)]
+        assert column("process_id") == [100 + i for i in range(10)]
+        assert column("opcode") == [i % 3 for i in range(10)]
+
+    async def test_columnar_no_events(self, fake_streamer: pyetwkit.EtwStreamer) -> None:
+        """Test that an idle session yields no empty batches before the timeout."""
+        async with fake_streamer:
+            batches = [batch async for batch in fake_streamer.events_columnar(timeout=0.1)]
+        assert batches == []
+
+    async def test_columnar_requires_start(self, fake_streamer: pyetwkit.EtwStreamer) -> None:
+        """Test that iterating a stopped streamer raises."""
+        with pytest.raises(RuntimeError, match="not running"):
+            async for _ in fake_streamer.events_columnar(timeout=0.1):
+                pass
+
+
+class TestEventQueue:
+    """Tests for the EventQueue ring buffer."""
+
+    @pytest.mark.parametrize("maxsize", [0, -1])
+    async def test_unbounded(self, maxsize: int) -> None:
+        """Test that maxsize <= 0 means unbounded, as with asyncio.Queue."""
+        queue = pyetwkit.streamer.EventQueue(maxsize=maxsize)
+        for i in range(200):
+            assert await queue.put(i)
+            if i % 3 == 0:
+                # Keep the head moving so growth has to unroll a wrapped ring
+                assert queue.get_nowait() == i // 3
+        assert not queue.full()
+        assert queue.overflow_count == 0
+        remaining = [queue.get_nowait() for _ in range(queue.qsize)]
+        assert remaining == list(range(67, 200))
+
+    async def test_fifo_order(self) -> None:
+        """Test that events come out in insertion order."""
+        queue = pyetwkit.streamer.EventQueue(maxsize=8)
+        for i in range(5):
+            assert await queue.put(i)
+        assert queue.qsize == 5
+        assert [await queue.get() for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert queue.empty()
+        assert queue.get_nowait() is None
+
+    async def test_wraparound(self) -> None:
+        """Test that order is kept when the ring buffer wraps past its end."""
+        queue = pyetwkit.streamer.EventQueue(maxsize=3)
+        received = []
+        for i in range(10):
+            await queue.put(i)
+            if queue.full():
+                received.append(queue.get_nowait())
+        while not queue.empty():
+            received.append(await queue.get())
+        assert received == list(range(10))
+
+    async def test_overflow_is_counted(self) -> None:
+        """Test that puts to a full queue are dropped and counted."""
+        queue = pyetwkit.streamer.EventQueue(maxsize=2)
+        assert await queue.put("a")
+        assert await queue.put("b")
+        assert queue.full()
+        assert not await queue.put("c")
+        assert not await queue.put("d")
+        assert queue.overflow_count == 2
+
+        # The events already queued are kept, and space frees up again
+        assert queue.get_nowait() == "a"
+        assert await queue.put("e")
+        assert [queue.get_nowait(), queue.get_nowait()] == ["b", "e"]
+        assert queue.overflow_count == 2
+
+    async def test_concurrent_getters(self) -> None:
+        """Test that several waiting get() calls each receive one event."""
+        queue = pyetwkit.streamer.EventQueue(maxsize=4)
+        waiters = [asyncio.create_task(queue.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert not any(w.done() for w in waiters)
+
+        for i in range(3):
+            await queue.put(i)
+        results = await asyncio.wait_for(asyncio.gather(*waiters), timeout=1.0)
+        assert sorted(results) == [0, 1, 2]
+        assert queue.empty()
+
+    async def test_put_threadsafe_from_worker(self) -> None:
+        """Test that a producer thread's events arrive in order on the loop."""
+        queue = pyetwkit.streamer.EventQueue(maxsize=100)
+
+        def produce() -> None:
+            for i in range(50):
+                assert queue.put_threadsafe(i)
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        received = [await asyncio.wait_for(queue.get(), timeout=1.0) for _ in range(50)]
+        thread.join()
+        assert received == list(range(50))
+        assert queue.overflow_count == 0
+
+    async def test_put_threadsafe_counts_overflow(self) -> None:
+        """Test that thread-side puts beyond maxsize are counted on the loop."""
+        queue = pyetwkit.streamer.EventQueue(maxsize=2)
+        thread = threading.Thread(target=lambda: [queue.put_threadsafe(i) for i in range(5)])
+        thread.start()
+        thread.join()
+        await asyncio.sleep(0)
+        assert queue.qsize == 2
+        assert queue.overflow_count == 3
+
+    def test_put_threadsafe_without_loop(self) -> None:
+        """Test that a queue created outside a loop rejects thread puts and counts them."""
+        queue = pyetwkit.streamer.EventQueue()
+        with pytest.raises(RuntimeError, match="not bound"):
+            queue.put_threadsafe("event")
+        assert queue.empty()
+        assert queue.overflow_count == 1
+
+    def test_put_threadsafe_after_loop_closed(self) -> None:
+        """Test that puts after the queue's loop closed are dropped and counted."""
+
+        async def make_queue() -> pyetwkit.streamer.EventQueue:
+            return pyetwkit.streamer.EventQueue()
+
+        queue = asyncio.run(make_queue())
+        assert not queue.put_threadsafe("event")
+        assert queue.overflow_count == 1
@@ -0,0 +1,165 @@
+"""Tests for typed ETW events."""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+# Skip the whole module at collection time if native extension is not available
+pytest.importorskip("pyetwkit_core", reason="Native extension not built")
+typed_events = importlib.import_module("pyetwkit.typed_events")
+
+KERNEL_PROCESS_GUID = "22fb2cd6-0e7b-422b-a0c7-2fad1fd0e716"
+
+
+def make_raw_event(**overrides: Any) -> SimpleNamespace:
+    """Build a stand-in for a raw EtwEvent with the attributes typed events read."""
+    values: dict[str, Any] = {
+        "event_id": 1,
+        "provider_id": "",
+        "provider_name": None,
+        "timestamp": None,
+        "process_id": 100,
+        "thread_id": 200,
+        "opcode": 0,
+        "level": 4,
+        "properties": {},
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestToTypedEvent:
+    """Tests for raw to typed event dispatch."""
+
+    def test_dispatch_by_guid(self) -> None:
+        """Test that a registered provider GUID selects the typed class."""
+        raw = make_raw_event(provider_id=KERNEL_PROCESS_GUID)
+        assert type(typed_events.to_typed_event(raw)) is typed_events.ProcessStartEvent
+
+    def test_dispatch_by_name_without_guid(self) -> None:
+        """Test that events without a GUID are dispatched by provider name."""
+        process = make_raw_event(provider_name="Microsoft-Windows-Kernel-Process")
+        assert type(typed_events.to_typed_event(process)) is typed_events.ProcessStartEvent
+
+        # Same event id, different provider: must not reuse the first resolution
+        dns = make_raw_event(event_id=3006, provider_name="Microsoft-Windows-DNS-Client")
+        assert type(typed_events.to_typed_event(dns)) is typed_events.DnsQueryEvent
+        unknown = make_raw_event(provider_name="Microsoft-Windows-DNS-Client")
+        assert type(typed_events.to_typed_event(unknown)) is typed_events.TypedEvent
+
+    def test_unknown_event_is_generic(self) -> None:
+        """Test that unregistered events fall back to TypedEvent."""
+        raw = make_raw_event(provider_id="00000000-0000-0000-0000-000000000001", event_id=99)
+        assert type(typed_events.to_typed_event(raw)) is typed_events.TypedEvent
+
+    def test_registry_is_read_only(self) -> None:
+        """Test that the public registries cannot be changed behind the dispatch cache."""
+        with pytest.raises(TypeError):
+            typed_events.EVENT_TYPE_REGISTRY[("{00000000-0000-0000-0000-000000000002}", 1)] = (
+                typed_events.ProcessStartEvent
+            )
+        with pytest.raises(TypeError):
+            typed_events.EVENT_TYPE_BY_NAME[("Custom-Provider", 1)] = typed_events.ProcessStartEvent
+
+    def test_register_after_dispatch(self) -> None:
+        """Test that registering a type replaces earlier cached dispatch results."""
+        guid = "00000000-0000-0000-0000-000000000003"
+        by_guid = make_raw_event(provider_id=guid, event_id=42)
+        by_name = make_raw_event(provider_name="Custom-Registered-Provider", event_id=42)
+        assert type(typed_events.to_typed_event(by_guid)) is typed_events.TypedEvent
+        assert type(typed_events.to_typed_event(by_name)) is typed_events.TypedEvent
+
+        typed_events.register_event_type(
+            guid, 42, typed_events.ProcessStopEvent, provider_name="Custom-Registered-Provider"
+        )
+        assert typed_events.EVENT_TYPE_REGISTRY[("{" + guid.upper() + "}", 42)] is (
+            typed_events.ProcessStopEvent
+        )
+        assert type(typed_events.to_typed_event(by_guid)) is typed_events.ProcessStopEvent
+        assert type(typed_events.to_typed_event(by_name)) is typed_events.ProcessStopEvent
+
+
+@pytest.fixture
+def empty_pool() -> Iterator[list[typed_events.TypedEvent]]:
+    """Start and finish each pooling test with an empty ProcessStartEvent pool."""
+    pool = typed_events.ProcessStartEvent._pool
+    pool.clear()
+    yield pool
+    pool.clear()
+
+
+class TestEventPool:
+    """Tests for TypedEvent instance recycling."""
+
+    def test_new_event_without_pool(self, empty_pool: list[typed_events.TypedEvent]) -> None:
+        """Test that construction allocates when the pool is empty."""
+        a = typed_events.ProcessStartEvent(process_id=1)
+        b = typed_events.ProcessStartEvent(process_id=2)
+        assert a is not b
+        assert not empty_pool
+
+    def test_released_event_is_reused(self, empty_pool: list[typed_events.TypedEvent]) -> None:
+        """Test that the next construction returns the released instance."""
+        event = typed_events.ProcessStartEvent(process_id=1)
+        event.release()
+        assert len(empty_pool) == 1
+        assert empty_pool[0] is event
+
+        reused = typed_events.ProcessStartEvent(process_id=2, image_file_name="b.exe")
+        assert reused is event
+        assert reused.process_id == 2
+        assert reused.image_file_name == "b.exe"
+        assert not empty_pool
+
+    @pytest.mark.usefixtures("empty_pool")
+    def test_release_resets_fields(self) -> None:
+        """Test that released events drop their field values."""
+        event = typed_events.ProcessStartEvent(
+            timestamp=datetime.now(),
+            process_id=1,
+            image_file_name="a.exe",
+            command_line="a.exe --flag",
+        )
+        event.release()
+        assert event.timestamp is None
+        assert event.process_id == 0
+        assert event.image_file_name == ""
+        assert event.command_line == ""
+
+    def test_double_release_is_ignored(self, empty_pool: list[typed_events.TypedEvent]) -> None:
+        """Test that releasing twice does not pool the same object twice."""
+        event = typed_events.ProcessStartEvent()
+        event.release()
+        event.release()
+        assert len(empty_pool) == 1
+
+        a = typed_events.ProcessStartEvent()
+        b = typed_events.ProcessStartEvent()
+        assert a is event
+        assert b is not a
+
+    def test_pool_is_bounded(
+        self, empty_pool: list[typed_events.TypedEvent], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that releases beyond _POOL_MAX are not kept."""
+        monkeypatch.setattr(typed_events.ProcessStartEvent, "_POOL_MAX", 2)
+        events = [typed_events.ProcessStartEvent() for _ in range(3)]
+        for event in events:
+            event.release()
+        assert len(empty_pool) == 2
+        assert all(pooled is event for pooled, event in zip(empty_pool, events))
+
+    def test_pools_are_per_class(self, empty_pool: list[typed_events.TypedEvent]) -> None:
+        """Test that a released event is only reused by its own class."""
+        typed_events.DnsQueryEvent._pool.clear()
+        event = typed_events.ProcessStartEvent()
+        event.release()
+        assert typed_events.DnsQueryEvent() is not event
+        assert len(empty_pool) == 1
+        assert empty_pool[0] is event